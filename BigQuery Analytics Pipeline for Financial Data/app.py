@@ -1,903 +1,1299 @@
-#!/usr/bin/env python3
-"""
-BigQuery Analytics Pipeline for Financial Data - GUI Application
-Fetches live stock data from Yahoo Finance, persists to CSV/SQL, runs analytics.
-"""
-
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import threading
-import sys
-import os
-from datetime import datetime
-import json
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from real_data_loader import fetch_yfinance_prices, compute_basic_indicators
-from looker_exporter import LookerDashboardBuilder, LookMLGenerator
-
-import pandas as pd
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
-import numpy as np
-
-# Optional Pillow for better image handling in Tkinter
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except Exception:
-    PIL_AVAILABLE = False
-
-
-class AnalyticsPipelineApp:
-    """Production-grade GUI for BigQuery analytics pipeline."""
-    
-    def __init__(self, root):
-        self.root = root
-        self.root.title("BigQuery Analytics Pipeline - Live Data Demo")
-        self.root.geometry("1000x800")
-        self.root.configure(bg='#f0f0f0')
-        
-        self.is_running = False
-        self.last_data = None
-        # Animation jobs
-        self._pulse_job = None
-        self._scroll_job = None
-        self._pulse_state = False
-        
-        self._build_ui()
-    
-    def _build_ui(self):
-        """Build the user interface."""
-        # Header
-        header_frame = tk.Frame(self.root, bg='#2c3e50', height=60)
-        header_frame.pack(fill=tk.X)
-        
-        title = tk.Label(header_frame, text="BigQuery Analytics Pipeline - Live Data",
-                        font=("Arial", 16, "bold"), bg='#2c3e50', fg='white', pady=10)
-        title.pack()
-        
-        # Main content
-        main_frame = tk.Frame(self.root, bg='#f0f0f0')
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Left panel: controls
-        left_panel = tk.Frame(main_frame, bg='white', relief=tk.RIDGE, bd=1)
-        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=False, padx=(0, 10), ipadx=10, ipady=10)
-        
-        # Symbols selection
-        tk.Label(left_panel, text="Stock Symbols", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
-        symbols_default = "AAPL,MSFT,GOOGL,TSLA,NVDA,META,AMZN,JPM"
-        self.symbols_entry = tk.Entry(left_panel, width=30, font=("Arial", 9))
-        self.symbols_entry.insert(0, symbols_default)
-        self.symbols_entry.pack(anchor=tk.W, pady=(0, 10))
-        tk.Label(left_panel, text="(comma-separated)", font=("Arial", 8), bg='white', fg='gray').pack(anchor=tk.W, pady=(0, 10))
-        
-        # Period selection
-        tk.Label(left_panel, text="Data Period", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
-        self.period_var = tk.StringVar(value="3mo")
-        for period in ["1mo", "3mo", "6mo", "1y"]:
-            ttk.Radiobutton(left_panel, text=period, variable=self.period_var, value=period).pack(anchor=tk.W)
-        
-        # Separator
-        ttk.Separator(left_panel, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
-        
-        # BigQuery options
-        tk.Label(left_panel, text="BigQuery (Optional)", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
-        
-        tk.Label(left_panel, text="Project ID", font=("Arial", 9), bg='white').pack(anchor=tk.W, pady=(5, 0))
-        self.project_entry = tk.Entry(left_panel, width=30, font=("Arial", 9))
-        self.project_entry.pack(anchor=tk.W, pady=(0, 8))
-        
-        tk.Label(left_panel, text="Dataset ID", font=("Arial", 9), bg='white').pack(anchor=tk.W, pady=(5, 0))
-        self.dataset_entry = tk.Entry(left_panel, width=30, font=("Arial", 9))
-        self.dataset_entry.insert(0, "financial_data")
-        self.dataset_entry.pack(anchor=tk.W, pady=(0, 10))
-        
-        # Separator
-        ttk.Separator(left_panel, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
-        
-        # Action buttons
-        tk.Label(left_panel, text="Actions", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
-        
-        self.fetch_btn = tk.Button(left_panel, text="📊 Fetch Live Data", bg='#27ae60', fg='white',
-                                  font=("Arial", 10, "bold"), width=25, command=self._fetch_data,
-                                  cursor="hand2", activebackground='#229954')
-        self.fetch_btn.pack(pady=5)
-        
-        self.analyze_btn = tk.Button(left_panel, text="📈 Run Analytics", bg='#3498db', fg='white',
-                                    font=("Arial", 10, "bold"), width=25, command=self._run_analytics,
-                                    cursor="hand2", activebackground='#2980b9', state=tk.DISABLED)
-        self.analyze_btn.pack(pady=5)
-        
-        self.export_btn = tk.Button(left_panel, text="📊 Export Dashboards", bg='#e74c3c', fg='white',
-                                   font=("Arial", 10, "bold"), width=25, command=self._export_dashboards,
-                                   cursor="hand2", activebackground='#c0392b', state=tk.DISABLED)
-        self.export_btn.pack(pady=5)
-        
-        self.clear_btn = tk.Button(left_panel, text="🔄 Clear Results", bg='#95a5a6', fg='white',
-                                  font=("Arial", 10, "bold"), width=25, command=self._clear_results,
-                                  cursor="hand2", activebackground='#7f8c8d')
-        self.clear_btn.pack(pady=5)
-
-        # Refresh visuals button
-        self.refresh_vis_btn = tk.Button(left_panel, text="🖼️ Refresh Visuals", bg='#8e44ad', fg='white',
-                         font=("Arial", 10, "bold"), width=25, command=self._refresh_visuals,
-                         cursor="hand2", activebackground='#7d3c98')
-        self.refresh_vis_btn.pack(pady=5)
-
-        # Prediction / Fine-tune controls
-        ttk.Separator(left_panel, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
-        tk.Label(left_panel, text="Prediction Parameters", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(5, 3))
-
-        prm_frame = tk.Frame(left_panel, bg='white')
-        prm_frame.pack(anchor=tk.W, pady=(0, 5))
-
-        tk.Label(prm_frame, text='SMA short', bg='white').grid(row=0, column=0, sticky='w')
-        self.sma_short_var = tk.IntVar(value=20)
-        tk.Entry(prm_frame, textvariable=self.sma_short_var, width=6).grid(row=0, column=1, padx=6)
-
-        tk.Label(prm_frame, text='SMA long', bg='white').grid(row=1, column=0, sticky='w')
-        self.sma_long_var = tk.IntVar(value=50)
-        tk.Entry(prm_frame, textvariable=self.sma_long_var, width=6).grid(row=1, column=1, padx=6)
-
-        tk.Label(prm_frame, text='RSI period', bg='white').grid(row=2, column=0, sticky='w')
-        self.rsi_period_var = tk.IntVar(value=14)
-        tk.Entry(prm_frame, textvariable=self.rsi_period_var, width=6).grid(row=2, column=1, padx=6)
-
-        tk.Label(prm_frame, text='RSI buy', bg='white').grid(row=3, column=0, sticky='w')
-        self.rsi_buy_var = tk.IntVar(value=30)
-        tk.Entry(prm_frame, textvariable=self.rsi_buy_var, width=6).grid(row=3, column=1, padx=6)
-
-        tk.Label(prm_frame, text='RSI sell', bg='white').grid(row=4, column=0, sticky='w')
-        self.rsi_sell_var = tk.IntVar(value=70)
-        tk.Entry(prm_frame, textvariable=self.rsi_sell_var, width=6).grid(row=4, column=1, padx=6)
-
-        self.predict_btn = tk.Button(left_panel, text="🔮 Compute Signals", bg='#f39c12', fg='white',
-                         font=("Arial", 10, "bold"), width=25, command=self._compute_signals,
-                         cursor="hand2", activebackground='#d78a0f')
-        self.predict_btn.pack(pady=(8, 5))
-        
-        # Right panel: output
-        right_panel = tk.Frame(main_frame, bg='white', relief=tk.RIDGE, bd=1)
-        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        # Use a Notebook so we can show both textual output and generated visuals
-        tk.Label(right_panel, text="Output & Results", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, padx=10, pady=(10, 5))
-        self.right_notebook = ttk.Notebook(right_panel)
-        self.right_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        # Text output tab
-        out_tab = tk.Frame(self.right_notebook, bg='white')
-        self.output = scrolledtext.ScrolledText(out_tab, font=("Courier", 9), bg='#f8f9fa',
-                               fg='#2c3e50', height=30, wrap=tk.WORD)
-        self.output.pack(fill=tk.BOTH, expand=True)
-        self.right_notebook.add(out_tab, text='Output')
-
-        # Visuals tab
-        vis_tab = tk.Frame(self.right_notebook, bg='white')
-        vis_frame = tk.Frame(vis_tab, bg='white')
-        vis_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Left: list of images
-        img_list_frame = tk.Frame(vis_frame, bg='white')
-        img_list_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10), pady=5)
-        tk.Label(img_list_frame, text='Visuals', bg='white', font=("Arial", 9, 'bold')).pack(anchor=tk.N)
-        self.image_listbox = tk.Listbox(img_list_frame, height=20, width=30)
-        self.image_listbox.pack(fill=tk.Y, expand=False)
-        self.image_listbox.bind('<<ListboxSelect>>', self._on_image_select)
-
-        # Right: image / JSON display container
-        img_display_frame = tk.Frame(vis_frame, bg='white')
-        img_display_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        self.visual_display_container = img_display_frame
-
-        # Image label (for PNGs)
-        self.image_label = tk.Label(img_display_frame, bg='white')
-        self.image_label.pack(fill=tk.BOTH, expand=True)
-
-        # JSON/text display (hidden by default)
-        self.json_text = scrolledtext.ScrolledText(img_display_frame, font=("Courier", 10), bg='#ffffff', wrap=tk.NONE)
-        self.json_text.pack(fill=tk.BOTH, expand=True)
-        self.json_text.pack_forget()
-
-        self.right_notebook.add(vis_tab, text='Visuals')
-
-        # Storage for loaded images to prevent GC
-        self._tk_images = {}
-        
-        # Footer
-        footer_frame = tk.Frame(self.root, bg='#ecf0f1', height=40)
-        footer_frame.pack(fill=tk.X)
-        
-        status_text = "Ready. Fetch live data from Yahoo Finance, analyze, and export to Looker dashboards."
-        self.status_label = tk.Label(footer_frame, text=status_text, font=("Arial", 9), bg='#ecf0f1', fg='#7f8c8d', pady=10)
-        self.status_label.pack(side=tk.LEFT, padx=10)
-        
-        # Log initial message
-        self._log("=== BigQuery Analytics Pipeline ===")
-        self._log(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self._log("Ready to fetch live stock data from Yahoo Finance.")
-        self._log("")
-    
-    def _log(self, message):
-        """Log message to output."""
-        self.output.insert(tk.END, message + "\n")
-        self.output.see(tk.END)
-        self.root.update()
-    
-    def _fetch_data(self):
-        """Fetch live data from Yahoo Finance in background thread."""
-        if self.is_running:
-            messagebox.showwarning("Running", "Another operation is in progress.")
-            return
-        
-        threading.Thread(target=self._fetch_data_thread, daemon=True).start()
-    
-    def _fetch_data_thread(self):
-        """Background thread for fetching data."""
-        self.is_running = True
-        self.fetch_btn.config(state=tk.DISABLED, bg='#95a5a6')
-        
-        try:
-            self._log("\n" + "="*50)
-            self._log("📊 FETCHING LIVE DATA FROM YAHOO FINANCE")
-            self._log("="*50)
-            
-            symbols = [s.strip().upper() for s in self.symbols_entry.get().split(',')]
-            period = self.period_var.get()
-            
-            self._log(f"Symbols: {', '.join(symbols)}")
-            self._log(f"Period: {period}")
-            self._log("Fetching prices...")
-            
-            # Fetch data
-            df = fetch_yfinance_prices(symbols, period=period, interval='1d')
-            
-            if df.empty:
-                self._log("❌ Error: No data returned from Yahoo Finance.")
-                messagebox.showerror("Error", "Failed to fetch data from Yahoo Finance.")
-                self.is_running = False
-                self.fetch_btn.config(state=tk.NORMAL, bg='#27ae60')
-                return
-            
-            self._log(f"✓ Fetched {len(df)} records")
-            self._log(f"Date range: {df['date'].min()} to {df['date'].max()}")
-            self._log(f"Symbols found: {', '.join(df['symbol'].unique())}")
-            
-            # Compute indicators
-            self._log("Computing technical indicators (SMA, RSI)...")
-            df = compute_basic_indicators(df)
-            self._log("✓ Indicators computed")
-            
-            # Save to CSV
-            self._log("Saving to CSV...")
-            csv_path = os.path.join(os.path.dirname(__file__), 'data', 'stock_prices.csv')
-            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-            df.to_csv(csv_path, index=False)
-            self._log(f"✓ Data saved to {csv_path}")
-            
-            # Generate SQL load script
-            self._log("Generating SQL load script...")
-            sql_path = os.path.join(os.path.dirname(__file__), 'sql', 'load_stock_prices.sql')
-            self._generate_sql_load(df, sql_path)
-            self._log(f"✓ SQL script generated at {sql_path}")
-            
-            # Store reference for analytics
-            self.last_data = df
-            
-            self._log("\n✅ Live data fetch complete!")
-            self._log("Next: Click 'Run Analytics' to analyze the data.")
-            self.analyze_btn.config(state=tk.NORMAL, bg='#3498db')
-            self._update_status("✓ Data fetched. Ready for analysis.")
-            
-        except Exception as e:
-            self._log(f"\n❌ Error fetching data: {str(e)}")
-            messagebox.showerror("Error", f"Failed to fetch data:\n{str(e)}")
-        
-        finally:
-            self.is_running = False
-            self.fetch_btn.config(state=tk.NORMAL, bg='#27ae60')
-    
-    def _generate_sql_load(self, df, sql_path):
-        """Generate SQL INSERT statements from data."""
-        os.makedirs(os.path.dirname(sql_path), exist_ok=True)
-        
-        with open(sql_path, 'w') as f:
-            f.write("-- Auto-generated SQL load script\n")
-            f.write("-- Insert stock prices into BigQuery\n\n")
-            f.write("BEGIN TRANSACTION;\n\n")
-            
-            for _, row in df.iterrows():
-                date_str = row['date']
-                symbol = row['symbol']
-                open_price = row.get('open', 0)
-                high = row.get('high', 0)
-                low = row.get('low', 0)
-                close = row.get('close', 0)
-                volume = int(row.get('volume', 0))
-                sma_20 = row.get('sma_20', None)
-                rsi_14 = row.get('rsi_14', None)
-                
-                sma_20_sql = f"{sma_20}" if sma_20 and not str(sma_20).lower() == 'nan' else "NULL"
-                rsi_14_sql = f"{rsi_14}" if rsi_14 and not str(rsi_14).lower() == 'nan' else "NULL"
-                
-                f.write(f"""INSERT INTO `{{project}}.{{dataset}}.stock_prices`
-  (date, symbol, open, high, low, close, volume, sma_20, rsi_14, fetch_timestamp)
-VALUES
-  ('{date_str}', '{symbol}', {open_price}, {high}, {low}, {close}, {volume}, {sma_20_sql}, {rsi_14_sql}, CURRENT_TIMESTAMP());\n""")
-            
-            f.write("\nCOMMIT TRANSACTION;\n")
-            f.write("\n-- Replace {project} and {dataset} with your actual BigQuery project and dataset IDs\n")
-    
-    def _run_analytics(self):
-        """Run analytics queries."""
-        if self.is_running:
-            messagebox.showwarning("Running", "Another operation is in progress.")
-            return
-        
-        if self.last_data is None or self.last_data.empty:
-            messagebox.showwarning("No Data", "Please fetch data first.")
-            return
-        
-        threading.Thread(target=self._run_analytics_thread, daemon=True).start()
-    
-    def _run_analytics_thread(self):
-        """Background thread for analytics."""
-        self.is_running = True
-        self.analyze_btn.config(state=tk.DISABLED, bg='#95a5a6')
-        
-        try:
-            self._log("\n" + "="*50)
-            self._log("📈 RUNNING ANALYTICS")
-            self._log("="*50)
-            
-            df = self.last_data
-            
-            # Local analytics (no BigQuery required)
-            self._log("\n1. PRICE STATISTICS")
-            self._log("-" * 40)
-            
-            for symbol in df['symbol'].unique():
-                sym_data = df[df['symbol'] == symbol]
-                avg_close = sym_data['close'].mean()
-                max_close = sym_data['close'].max()
-                min_close = sym_data['close'].min()
-                latest = sym_data.iloc[-1]['close']
-                
-                self._log(f"\n{symbol}:")
-                self._log(f"  Latest: ${latest:.2f}")
-                self._log(f"  Average: ${avg_close:.2f}")
-                self._log(f"  High: ${max_close:.2f}")
-                self._log(f"  Low: ${min_close:.2f}")
-            
-            # Technical indicators
-            self._log("\n2. TECHNICAL INDICATORS")
-            self._log("-" * 40)
-            
-            for symbol in df['symbol'].unique():
-                sym_data = df[df['symbol'] == symbol].iloc[-1]
-                sma = sym_data.get('sma_20', 'N/A')
-                rsi = sym_data.get('rsi_14', 'N/A')
-                
-                sma_str = f"{sma:.2f}" if sma and str(sma).lower() != 'nan' else "N/A"
-                rsi_str = f"{rsi:.2f}" if rsi and str(rsi).lower() != 'nan' else "N/A"
-                
-                self._log(f"{symbol}: SMA(20)={sma_str}, RSI(14)={rsi_str}")
-            
-            # Volume analysis
-            self._log("\n3. VOLUME ANALYSIS")
-            self._log("-" * 40)
-            
-            for symbol in df['symbol'].unique():
-                sym_data = df[df['symbol'] == symbol]
-                avg_vol = sym_data['volume'].mean()
-                max_vol = sym_data['volume'].max()
-                
-                self._log(f"{symbol}: Avg Volume={avg_vol:,.0f}, Max={max_vol:,.0f}")
-            
-            self._log("\n✅ Analytics complete!")
-            self._log("Next: Click 'Export Dashboards' to generate Looker configs.")
-            self.export_btn.config(state=tk.NORMAL, bg='#e74c3c')
-            self._update_status("✓ Analytics complete. Ready to export dashboards.")
-            
-        except Exception as e:
-            self._log(f"\n❌ Error during analytics: {str(e)}")
-            messagebox.showerror("Error", f"Analytics failed:\n{str(e)}")
-        
-        finally:
-            self.is_running = False
-            self.analyze_btn.config(state=tk.NORMAL, bg='#3498db')
-    
-    def _export_dashboards(self):
-        """Export Looker dashboards."""
-        if self.is_running:
-            messagebox.showwarning("Running", "Another operation is in progress.")
-            return
-        
-        if self.last_data is None or self.last_data.empty:
-            messagebox.showwarning("No Data", "Please fetch data first.")
-            return
-        
-        threading.Thread(target=self._export_dashboards_thread, daemon=True).start()
-    
-    def _export_dashboards_thread(self):
-        """Background thread for dashboard export."""
-        self.is_running = True
-        self.export_btn.config(state=tk.DISABLED, bg='#95a5a6')
-        
-        try:
-            self._log("\n" + "="*50)
-            self._log("📊 EXPORTING LOOKER DASHBOARDS")
-            self._log("="*50)
-            
-            # Use provided project/dataset or default to demo values
-            project_id = self.project_entry.get() or "financial-analytics-demo"
-            dataset_id = self.dataset_entry.get() or "financial_data"
-            
-            builder = LookerDashboardBuilder(project_id, dataset_id)
-
-            # Generate visuals (candlesticks, summary charts) and attach to dashboards
-            images_dir = os.path.join(os.path.dirname(__file__), 'looker', 'images')
-            os.makedirs(images_dir, exist_ok=True)
-            try:
-                images = self._generate_visuals(self.last_data, images_dir)
-                self._log(f"✓ Generated {len(images)} visualization images")
-                # Load visuals into GUI (schedule on main thread)
-                try:
-                    self.root.after(100, lambda: self._load_visuals(images_dir))
-                except Exception:
-                    pass
-            except Exception as e:
-                self._log(f"⚠️ Warning: visual generation failed: {e}")
-                images = {}
-            
-            # Stock Performance Dashboard
-            self._log("Generating: Stock Performance Dashboard...")
-            dashboard_stock = builder.create_stock_performance_dashboard()
-            # attach summary image if exists
-            if 'summary' in images:
-                dashboard_stock['image'] = images['summary']
-            stock_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_stock_performance.json')
-            os.makedirs(os.path.dirname(stock_path), exist_ok=True)
-            
-            with open(stock_path, 'w') as f:
-                json.dump(dashboard_stock, f, indent=2)
-            self._log(f"✓ Saved: {stock_path}")
-            
-            # Market Analysis Dashboard
-            self._log("Generating: Market Analysis Dashboard...")
-            dashboard_market = builder.create_market_analysis_dashboard()
-            if 'volatility' in images:
-                dashboard_market['image'] = images['volatility']
-            market_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_market_analysis.json')
-            
-            with open(market_path, 'w') as f:
-                json.dump(dashboard_market, f, indent=2)
-            self._log(f"✓ Saved: {market_path}")
-            
-            # Portfolio Dashboard
-            self._log("Generating: Portfolio Dashboard...")
-            dashboard_portfolio = builder.create_portfolio_dashboard()
-            if 'portfolio' in images:
-                dashboard_portfolio['image'] = images['portfolio']
-            portfolio_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_portfolio.json')
-            
-            with open(portfolio_path, 'w') as f:
-                json.dump(dashboard_portfolio, f, indent=2)
-            self._log(f"✓ Saved: {portfolio_path}")
-            
-            # KPI Dashboard
-            self._log("Generating: KPI Summary Dashboard...")
-            dashboard_kpi = builder.create_kpi_dashboard()
-            if 'kpi' in images:
-                dashboard_kpi['image'] = images['kpi']
-            kpi_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_kpi_summary.json')
-            
-            with open(kpi_path, 'w') as f:
-                json.dump(dashboard_kpi, f, indent=2)
-            self._log(f"✓ Saved: {kpi_path}")
-            
-            # LookML Views (use LookMLGenerator)
-            self._log("Generating: LookML Views...")
-            generator = LookMLGenerator(project_id, dataset_id)
-            stock_view = generator.generate_stock_prices_view()
-            view_path = os.path.join(os.path.dirname(__file__), 'looker', 'stock_prices.view.lkml')
-            
-            with open(view_path, 'w') as f:
-                f.write(stock_view)
-            self._log(f"✓ Saved: {view_path}")
-            
-            self._log("\n✅ All dashboards exported successfully!")
-            self._log("Check the 'looker/' directory for JSON files and LookML views.")
-            self._update_status("✓ Dashboards exported. Project complete!")
-            
-        except Exception as e:
-            self._log(f"\n❌ Error exporting dashboards: {str(e)}")
-            messagebox.showerror("Error", f"Dashboard export failed:\n{str(e)}")
-        
-        finally:
-            self.is_running = False
-            self.export_btn.config(state=tk.NORMAL, bg='#e74c3c')
-    
-    def _clear_results(self):
-        """Clear output and reset state."""
-        self.output.delete(1.0, tk.END)
-        self.analyze_btn.config(state=tk.DISABLED, bg='#95a5a6')
-        self.export_btn.config(state=tk.DISABLED, bg='#95a5a6')
-        self._log("=== BigQuery Analytics Pipeline ===")
-        self._log(f"Reset: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self._log("Ready to fetch live stock data from Yahoo Finance.")
-        self._update_status("Ready.")
-    
-    def _generate_visuals(self, df: pd.DataFrame, out_dir: str) -> dict:
-        """Generate visualizations (candlestick, summary, volatility, kpi) and save PNGs.
-
-        Returns dict mapping keys to relative image paths.
-        """
-        images = {}
-        if df is None or df.empty:
-            return images
-
-        df = df.copy()
-        # Ensure date column is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df['date']):
-            df['date'] = pd.to_datetime(df['date'])
-
-        # Summary: multiple lines of close prices
-        try:
-            fig, ax = plt.subplots(figsize=(10, 4))
-            for sym in df['symbol'].unique():
-                s = df[df['symbol'] == sym].sort_values('date')
-                ax.plot(s['date'], s['close'], label=sym, linewidth=1.1)
-            ax.set_title('Market Close Prices')
-            ax.set_xlabel('Date')
-            ax.set_ylabel('Close')
-            ax.legend(loc='upper left')
-            summary_path = os.path.join(out_dir, 'market_summary.png')
-            fig.tight_layout()
-            fig.savefig(summary_path)
-            plt.close(fig)
-            images['summary'] = os.path.relpath(summary_path, os.path.dirname(__file__))
-        except Exception:
-            pass
-
-        # Volatility chart
-        try:
-            vol = df.groupby('symbol')['close'].pct_change().std().reset_index()
-            vol.columns = ['symbol', 'volatility']
-            fig, ax = plt.subplots(figsize=(6, 3))
-            ax.bar(vol['symbol'], vol['volatility'], color='orange')
-            ax.set_title('Volatility by Symbol')
-            vol_path = os.path.join(out_dir, 'volatility.png')
-            fig.tight_layout()
-            fig.savefig(vol_path)
-            plt.close(fig)
-            images['volatility'] = os.path.relpath(vol_path, os.path.dirname(__file__))
-        except Exception:
-            pass
-
-        # KPI summary image (simple text panel)
-        try:
-            latest = df.sort_values(['symbol', 'date']).groupby('symbol').tail(1)
-            kpi_fig, kpi_ax = plt.subplots(figsize=(6, 2))
-            kpi_ax.axis('off')
-            lines = []
-            for _, r in latest.iterrows():
-                lines.append(f"{r['symbol']}: {r['close']:.2f}")
-            kpi_ax.text(0.01, 0.98, '\n'.join(lines), va='top', fontsize=10, family='monospace')
-            kpi_path = os.path.join(out_dir, 'kpi_summary.png')
-            kpi_fig.tight_layout()
-            kpi_fig.savefig(kpi_path)
-            plt.close(kpi_fig)
-            images['kpi'] = os.path.relpath(kpi_path, os.path.dirname(__file__))
-        except Exception:
-            pass
-
-        # Candlesticks per symbol (save up to 6 symbols)
-        try:
-            symbols = list(df['symbol'].unique())[:6]
-            for sym in symbols:
-                s = df[df['symbol'] == sym].sort_values('date')
-                fig, ax = plt.subplots(figsize=(8, 4))
-                for _, row in s.iterrows():
-                    o, h, l, c = row['open'], row['high'], row['low'], row['close']
-                    color = 'green' if c >= o else 'red'
-                    # wick
-                    ax.vlines(row['date'], l, h, color='black', linewidth=0.6)
-                    # body
-                    rect = Rectangle((matplotlib.dates.date2num(row['date']) - 0.3, min(o, c)), 0.6, abs(c - o),
-                                     facecolor=color, edgecolor='black')
-                    ax.add_patch(rect)
-                ax.set_title(f'Candlestick: {sym}')
-                ax.set_xlim([s['date'].min(), s['date'].max()])
-                ax.xaxis_date()
-                fig.autofmt_xdate()
-                cpath = os.path.join(out_dir, f'candlestick_{sym}.png')
-                fig.tight_layout()
-                fig.savefig(cpath)
-                plt.close(fig)
-                images[f'candle_{sym}'] = os.path.relpath(cpath, os.path.dirname(__file__))
-        except Exception:
-            pass
-
-        return images
-    
-    def _load_visuals(self, images_dir: str):
-        """Load images from `images_dir` into the visuals tab listbox."""
-        try:
-            if not os.path.isdir(images_dir):
-                return
-
-            files = [f for f in os.listdir(images_dir) if f.lower().endswith('.png')]
-            files.sort()
-
-            # Clear listbox
-            self.image_listbox.delete(0, tk.END)
-            self._tk_images.clear()
-
-            # also include JSON and LookML files
-            extra = [f for f in os.listdir(os.path.dirname(images_dir)) if f.lower().endswith(('.json', '.lkml'))]
-            items = files + extra
-
-            for fname in items:
-                full = os.path.join(images_dir, fname) if fname in files else os.path.join(os.path.dirname(images_dir), fname)
-                display_name = fname
-                self.image_listbox.insert(tk.END, display_name)
-                tkimg = None
-                # Preload image thumbnails only for PNGs
-                if fname.lower().endswith('.png'):
-                    try:
-                        if PIL_AVAILABLE:
-                            img = Image.open(full)
-                            img.thumbnail((900, 600))
-                            tkimg = ImageTk.PhotoImage(img)
-                        else:
-                            tkimg = tk.PhotoImage(file=full)
-                    except Exception:
-                        tkimg = None
-
-                ftype = 'png' if fname.lower().endswith('.png') else ('json' if fname.lower().endswith('.json') else 'lkml')
-                self._tk_images[display_name] = (full, tkimg, ftype)
-
-            # If at least one image, select the first
-            if items:
-                self.image_listbox.selection_set(0)
-                self._show_file_by_name(items[0])
-        except Exception:
-            pass
-
-    def _show_image_by_name(self, name: str):
-        entry = self._tk_images.get(name)
-        if not entry:
-            return
-        full, tkimg, ftype = entry
-        # stop other animations
-        self._stop_image_pulse()
-        self._stop_json_scroll()
-
-        if ftype == 'png':
-            # show image widget
-            self.json_text.pack_forget()
-            self.image_label.pack(fill=tk.BOTH, expand=True)
-            if tkimg:
-                self.image_label.config(image=tkimg, text='')
-                self.image_label.image = tkimg
-            else:
-                self.image_label.config(image='', text=full)
-
-            # start a gentle pulse to draw attention
-            self._start_image_pulse()
-        else:
-            # show JSON/LKML in text view
-            self.image_label.pack_forget()
-            self.json_text.pack(fill=tk.BOTH, expand=True)
-            try:
-                with open(full, 'r', encoding='utf-8') as fh:
-                    content = fh.read()
-                # try pretty JSON if possible
-                if ftype == 'json':
-                    try:
-                        j = json.loads(content)
-                        pretty = json.dumps(j, indent=2)
-                    except Exception:
-                        pretty = content
-                else:
-                    pretty = content
-
-                self.json_text.delete(1.0, tk.END)
-                self.json_text.insert(tk.END, pretty)
-                self.json_text.see('1.0')
-                # start auto-scroll animation
-                self._start_json_scroll()
-            except Exception:
-                self.json_text.delete(1.0, tk.END)
-                self.json_text.insert(tk.END, f"Failed to open {full}")
-
-    def _on_image_select(self, _event=None):
-        try:
-            sel = self.image_listbox.curselection()
-            if not sel:
-                return
-            idx = sel[0]
-            name = self.image_listbox.get(idx)
-            self._show_file_by_name(name)
-        except Exception:
-            pass
-
-    def _refresh_visuals(self):
-        images_dir = os.path.join(os.path.dirname(__file__), 'looker', 'images')
-        self._load_visuals(images_dir)
-
-    # --- Animations: image pulse and JSON auto-scroll ---
-    def _start_image_pulse(self, interval: int = 600):
-        try:
-            self._stop_image_pulse()
-            self._pulse_state = False
-
-            def _pulse():
-                try:
-                    self._pulse_state = not self._pulse_state
-                    color = '#ffffff' if self._pulse_state else '#f7f1ff'
-                    self.image_label.config(bg=color)
-                    self._pulse_job = self.root.after(interval, _pulse)
-                except Exception:
-                    pass
-
-            _pulse()
-        except Exception:
-            pass
-
-    def _stop_image_pulse(self):
-        try:
-            if self._pulse_job:
-                self.root.after_cancel(self._pulse_job)
-                self._pulse_job = None
-                self.image_label.config(bg='white')
-        except Exception:
-            pass
-
-    def _start_json_scroll(self, interval: int = 1200):
-        try:
-            self._stop_json_scroll()
-
-            def _scroll():
-                try:
-                    # move view down a bit
-                    self.json_text.yview_scroll(1, 'pages')
-                    # wrap back to top when at end
-                    if float(self.json_text.index('end-1c').split('.')[0]) <= float(self.json_text.index(tk.END).split('.')[0]):
-                        pass
-                    self._scroll_job = self.root.after(interval, _scroll)
-                except Exception:
-                    pass
-
-            self._scroll_job = self.root.after(interval, _scroll)
-        except Exception:
-            pass
-
-    def _stop_json_scroll(self):
-        try:
-            if self._scroll_job:
-                self.root.after_cancel(self._scroll_job)
-                self._scroll_job = None
-        except Exception:
-            pass
-
-    def _show_file_by_name(self, name: str):
-        """Generic dispatcher to show image or JSON by name."""
-        entry = self._tk_images.get(name)
-        if not entry:
-            return
-        full, tkimg, ftype = entry
-        if ftype == 'png':
-            self._show_image_by_name(name)
-        else:
-            self._show_image_by_name(name)
-
-    def _compute_signals(self):
-        """Run signal computation in background."""
-        if self.is_running:
-            messagebox.showwarning("Running", "Another operation is in progress.")
-            return
-
-        if self.last_data is None or self.last_data.empty:
-            messagebox.showwarning("No Data", "Please fetch data first.")
-            return
-
-        threading.Thread(target=self._compute_signals_thread, daemon=True).start()
-
-    def _calculate_rsi(self, series: pd.Series, period: int = 14) -> pd.Series:
-        delta = series.diff()
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-        avg_gain = gain.ewm(com=period - 1, adjust=False).mean()
-        avg_loss = loss.ewm(com=period - 1, adjust=False).mean()
-        rs = avg_gain / (avg_loss.replace(0, np.nan))
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.fillna(50)
-
-    def _compute_signals_thread(self):
-        """Compute simple SMA crossover + RSI-based buy/hold/sell signals."""
-        try:
-            self._log("\n🔮 Computing buy/sell signals...")
-            df = self.last_data.copy()
-            sma_short = max(2, int(self.sma_short_var.get()))
-            sma_long = max(sma_short + 1, int(self.sma_long_var.get()))
-            rsi_period = max(2, int(self.rsi_period_var.get()))
-            rsi_buy = int(self.rsi_buy_var.get())
-            rsi_sell = int(self.rsi_sell_var.get())
-
-            results = []
-            for sym in df['symbol'].unique():
-                s = df[df['symbol'] == sym].sort_values('date').reset_index(drop=True).copy()
-                if len(s) < max(sma_long, rsi_period) + 1:
-                    results.append((sym, 'HOLD', 'insufficient data'))
-                    continue
-
-                s['sma_short'] = s['close'].rolling(window=sma_short).mean()
-                s['sma_long'] = s['close'].rolling(window=sma_long).mean()
-                s['rsi'] = self._calculate_rsi(s['close'], period=rsi_period)
-
-                last = s.iloc[-1]
-                prev = s.iloc[-2]
-
-                # SMA signal
-                sma_signal = 'NEUTRAL'
-                if last['sma_short'] > last['sma_long'] and prev['sma_short'] <= prev['sma_long']:
-                    sma_signal = 'BUY'
-                elif last['sma_short'] < last['sma_long'] and prev['sma_short'] >= prev['sma_long']:
-                    sma_signal = 'SELL'
-                else:
-                    sma_signal = 'HOLD'
-
-                # RSI signal
-                rsi_signal = 'NEUTRAL'
-                if last['rsi'] <= rsi_buy:
-                    rsi_signal = 'BUY'
-                elif last['rsi'] >= rsi_sell:
-                    rsi_signal = 'SELL'
-                else:
-                    rsi_signal = 'HOLD'
-
-                # Combine signals (simple rule): BUY if any BUY and no SELL; SELL if any SELL and no BUY; else HOLD
-                final = 'HOLD'
-                if sma_signal == 'BUY' or rsi_signal == 'BUY':
-                    if not (sma_signal == 'SELL' or rsi_signal == 'SELL'):
-                        final = 'BUY'
-                if sma_signal == 'SELL' or rsi_signal == 'SELL':
-                    if not (sma_signal == 'BUY' or rsi_signal == 'BUY'):
-                        final = 'SELL'
-
-                note = f"SMA:{sma_signal} RSI:{rsi_signal} (rsi={last['rsi']:.1f})"
-                results.append((sym, final, note))
-
-            # Print results
-            self._log('\nSignal Results:')
-            for sym, sig, note in results:
-                self._log(f"  {sym}: {sig} — {note}")
-
-            self._update_status("✓ Signals computed")
-        except Exception as e:
-            self._log(f"\n❌ Error computing signals: {e}")
-        finally:
-            pass
-
-    def _update_status(self, message):
-        """Update status bar."""
-        self.status_label.config(text=message)
-
-
-def main():
-    """Main entry point."""
-    root = tk.Tk()
-    app = AnalyticsPipelineApp(root)
-    root.mainloop()
-
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python3
+"""
+BigQuery Analytics Pipeline for Financial Data - GUI Application
+Fetches live stock data from Yahoo Finance, persists to CSV/SQL, runs analytics.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+import threading
+import sys
+import os
+import hashlib
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+import json
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from real_data_loader import fetch_yfinance_prices, compute_basic_indicators
+from looker_exporter import LookerDashboardBuilder, LookMLGenerator
+
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+import numpy as np
+
+# Optional Pillow for better image handling in Tkinter
+try:
+    from PIL import Image, ImageTk
+    PIL_AVAILABLE = True
+except Exception:
+    PIL_AVAILABLE = False
+
+# Optional pyvips for shrink-on-load thumbnail decoding
+try:
+    import pyvips
+    PYVIPS_AVAILABLE = True
+except Exception:
+    PYVIPS_AVAILABLE = False
+
+# Optional orjson for fast dashboard JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+# Optional Numba for the RSI hot path
+try:
+    from numba import njit as _njit
+except Exception:
+    _njit = None
+
+
+def _rsi_kernel(close, period):
+    """Fused Wilder-RSI pass over one close-price array.
+
+    Uses Wilder's RMA recursion (alpha = 1/period, equivalent to
+    ewm(alpha=1/period, adjust=False)) and computes the final RSI in the
+    same loop; compiled by Numba when it is installed. All-gain stretches
+    read 100 (rs -> inf) and flat stretches 50 (RSI undefined).
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n):
+        if i == 0:
+            out[i] = 50.0
+            continue
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = (1.0 - alpha) * avg_gain + alpha * gain
+            avg_loss = (1.0 - alpha) * avg_loss + alpha * loss
+        if avg_loss == 0.0:
+            out[i] = 100.0 if avg_gain > 0.0 else 50.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+def _rsi_vectorized(close, period):
+    """Vectorized Wilder-RSI with the same semantics as _rsi_kernel.
+
+    Used when Numba is not installed: ewm(alpha=1/period, adjust=False)
+    runs the RMA recursion in C, so the default install never pays for an
+    interpreted per-element loop.
+    """
+    n = close.shape[0]
+    out = np.full(n, 50.0)
+    if n < 2:
+        return out
+    delta = np.diff(close)
+    alpha = 1.0 / period
+    avg_gain = pd.Series(np.where(delta > 0.0, delta, 0.0)).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    avg_loss = pd.Series(np.where(delta < 0.0, -delta, 0.0)).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    out[1:] = np.where(
+        avg_loss > 0.0,
+        100.0 - 100.0 / (1.0 + avg_gain / np.where(avg_loss > 0.0, avg_loss, 1.0)),
+        np.where(avg_gain > 0.0, 100.0, 50.0),
+    )
+    return out
+
+
+if _njit is not None:
+    _rsi_kernel = _njit(cache=True, fastmath=True)(_rsi_kernel)
+else:
+    _rsi_kernel = _rsi_vectorized
+
+
+def _render_candlestick(sym, s, out_dir, dpi=80):
+    """Render one symbol's candlestick chart to PNG.
+
+    Module-level so it is picklable and can run in a worker process.
+    Returns (symbol, path relative to the app dir, PNG basename, RGBA buffer).
+    """
+    dates_num = matplotlib.dates.date2num(s['date'].to_numpy())
+    opens, highs, lows, closes = s[['open', 'high', 'low', 'close']].to_numpy().T
+
+    fig = Figure(figsize=(8, 4), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    # wicks
+    segments = np.stack([np.column_stack([dates_num, lows]),
+                         np.column_stack([dates_num, highs])], axis=1)
+    ax.add_collection(LineCollection(segments, colors='black', linewidths=0.6))
+    # bodies
+    bodies = [Rectangle((x - 0.3, min(o, c)), 0.6, abs(c - o))
+              for x, o, c in zip(dates_num, opens, closes)]
+    colors = np.where(closes >= opens, 'green', 'red')
+    ax.add_collection(PatchCollection(bodies, facecolors=colors, edgecolors='black'))
+    ax.set_title(f'Candlestick: {sym}')
+    ax.set_xlim([dates_num.min(), dates_num.max()])
+    ax.set_ylim([lows.min(), highs.max()])
+    ax.xaxis_date()
+    fig.autofmt_xdate()
+    cpath = os.path.join(out_dir, f'candlestick_{sym}.png')
+    fig.savefig(cpath, dpi=dpi, bbox_inches=None, pad_inches=0.05)
+    canvas.draw()
+    rgba = np.asarray(canvas.buffer_rgba()).copy()
+    return sym, os.path.relpath(cpath, os.path.dirname(__file__)), os.path.basename(cpath), rgba
+
+
+class AnalyticsPipelineApp:
+    """Production-grade GUI for BigQuery analytics pipeline."""
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("BigQuery Analytics Pipeline - Live Data Demo")
+        self.root.geometry("1000x800")
+        self.root.configure(bg='#f0f0f0')
+        
+        self.is_running = False
+        self.last_data = None
+        # Per-symbol sub-frames, built once per fetch to avoid repeated
+        # boolean-mask slicing in analytics and chart generation
+        self.symbol_groups = {}
+        # Latest row per symbol (indexed by symbol), shared by analytics,
+        # KPI panel, and dashboard export
+        self.latest_per_symbol = None
+        # In-memory RGBA buffers from chart rendering, keyed by PNG basename,
+        # so the visuals tab can skip the PNG encode/decode round-trip
+        self._rgba_buffers = {}
+        # Animations: one master tick timer drives both the image pulse and
+        # the JSON auto-scroll, and pauses while the window is unfocused
+        self._tick_job = None
+        self._tick_count = 0
+        self._pulse_active = False
+        self._scroll_active = False
+        self._pulse_state = False
+        self._anim_paused = False
+        self.root.bind('<FocusIn>', self._resume_animations)
+        self.root.bind('<Map>', self._resume_animations)
+        self.root.bind('<FocusOut>', self._pause_animations)
+        self.root.bind('<Unmap>', self._pause_animations)
+        # Monotonic token guarding streamed text inserts against stale writers
+        self._text_token = 0
+        # Pending log lines, drained in batches by a root.after timer
+        self._log_queue = deque()
+        self._log_drain_job = None
+        # Background pool for thumbnail decoding (PIL releases the GIL in
+        # the codec, so threads overlap nicely)
+        self._thumb_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+        # LRU-bounded PhotoImage cache; Tk pins image memory for every live
+        # PhotoImage, so only the most recently viewed thumbnails stay alive
+        self._thumb_cache = OrderedDict()
+        self._thumb_cache_max = 32
+        
+        self._build_ui()
+    
+    def _build_ui(self):
+        """Build the user interface."""
+        # Header
+        header_frame = tk.Frame(self.root, bg='#2c3e50', height=60)
+        header_frame.pack(fill=tk.X)
+        
+        title = tk.Label(header_frame, text="BigQuery Analytics Pipeline - Live Data",
+                        font=("Arial", 16, "bold"), bg='#2c3e50', fg='white', pady=10)
+        title.pack()
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg='#f0f0f0')
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Left panel: controls
+        left_panel = tk.Frame(main_frame, bg='white', relief=tk.RIDGE, bd=1)
+        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=False, padx=(0, 10), ipadx=10, ipady=10)
+        
+        # Symbols selection
+        tk.Label(left_panel, text="Stock Symbols", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
+        symbols_default = "AAPL,MSFT,GOOGL,TSLA,NVDA,META,AMZN,JPM"
+        self.symbols_entry = tk.Entry(left_panel, width=30, font=("Arial", 9))
+        self.symbols_entry.insert(0, symbols_default)
+        self.symbols_entry.pack(anchor=tk.W, pady=(0, 10))
+        tk.Label(left_panel, text="(comma-separated)", font=("Arial", 8), bg='white', fg='gray').pack(anchor=tk.W, pady=(0, 10))
+        
+        # Period selection
+        tk.Label(left_panel, text="Data Period", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
+        self.period_var = tk.StringVar(value="3mo")
+        for period in ["1mo", "3mo", "6mo", "1y"]:
+            ttk.Radiobutton(left_panel, text=period, variable=self.period_var, value=period).pack(anchor=tk.W)
+        
+        # Separator
+        ttk.Separator(left_panel, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
+        
+        # BigQuery options
+        tk.Label(left_panel, text="BigQuery (Optional)", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
+        
+        tk.Label(left_panel, text="Project ID", font=("Arial", 9), bg='white').pack(anchor=tk.W, pady=(5, 0))
+        self.project_entry = tk.Entry(left_panel, width=30, font=("Arial", 9))
+        self.project_entry.pack(anchor=tk.W, pady=(0, 8))
+        
+        tk.Label(left_panel, text="Dataset ID", font=("Arial", 9), bg='white').pack(anchor=tk.W, pady=(5, 0))
+        self.dataset_entry = tk.Entry(left_panel, width=30, font=("Arial", 9))
+        self.dataset_entry.insert(0, "financial_data")
+        self.dataset_entry.pack(anchor=tk.W, pady=(0, 10))
+        
+        # Separator
+        ttk.Separator(left_panel, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
+        
+        # Action buttons
+        tk.Label(left_panel, text="Actions", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(0, 5))
+        
+        self.fetch_btn = tk.Button(left_panel, text="📊 Fetch Live Data", bg='#27ae60', fg='white',
+                                  font=("Arial", 10, "bold"), width=25, command=self._fetch_data,
+                                  cursor="hand2", activebackground='#229954')
+        self.fetch_btn.pack(pady=5)
+        
+        self.analyze_btn = tk.Button(left_panel, text="📈 Run Analytics", bg='#3498db', fg='white',
+                                    font=("Arial", 10, "bold"), width=25, command=self._run_analytics,
+                                    cursor="hand2", activebackground='#2980b9', state=tk.DISABLED)
+        self.analyze_btn.pack(pady=5)
+        
+        self.export_btn = tk.Button(left_panel, text="📊 Export Dashboards", bg='#e74c3c', fg='white',
+                                   font=("Arial", 10, "bold"), width=25, command=self._export_dashboards,
+                                   cursor="hand2", activebackground='#c0392b', state=tk.DISABLED)
+        self.export_btn.pack(pady=5)
+        
+        self.clear_btn = tk.Button(left_panel, text="🔄 Clear Results", bg='#95a5a6', fg='white',
+                                  font=("Arial", 10, "bold"), width=25, command=self._clear_results,
+                                  cursor="hand2", activebackground='#7f8c8d')
+        self.clear_btn.pack(pady=5)
+
+        # Refresh visuals button
+        self.refresh_vis_btn = tk.Button(left_panel, text="🖼️ Refresh Visuals", bg='#8e44ad', fg='white',
+                         font=("Arial", 10, "bold"), width=25, command=self._refresh_visuals,
+                         cursor="hand2", activebackground='#7d3c98')
+        self.refresh_vis_btn.pack(pady=5)
+
+        # Prediction / Fine-tune controls
+        ttk.Separator(left_panel, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
+        tk.Label(left_panel, text="Prediction Parameters", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, pady=(5, 3))
+
+        prm_frame = tk.Frame(left_panel, bg='white')
+        prm_frame.pack(anchor=tk.W, pady=(0, 5))
+
+        tk.Label(prm_frame, text='SMA short', bg='white').grid(row=0, column=0, sticky='w')
+        self.sma_short_var = tk.IntVar(value=20)
+        tk.Entry(prm_frame, textvariable=self.sma_short_var, width=6).grid(row=0, column=1, padx=6)
+
+        tk.Label(prm_frame, text='SMA long', bg='white').grid(row=1, column=0, sticky='w')
+        self.sma_long_var = tk.IntVar(value=50)
+        tk.Entry(prm_frame, textvariable=self.sma_long_var, width=6).grid(row=1, column=1, padx=6)
+
+        tk.Label(prm_frame, text='RSI period', bg='white').grid(row=2, column=0, sticky='w')
+        self.rsi_period_var = tk.IntVar(value=14)
+        tk.Entry(prm_frame, textvariable=self.rsi_period_var, width=6).grid(row=2, column=1, padx=6)
+
+        tk.Label(prm_frame, text='RSI buy', bg='white').grid(row=3, column=0, sticky='w')
+        self.rsi_buy_var = tk.IntVar(value=30)
+        tk.Entry(prm_frame, textvariable=self.rsi_buy_var, width=6).grid(row=3, column=1, padx=6)
+
+        tk.Label(prm_frame, text='RSI sell', bg='white').grid(row=4, column=0, sticky='w')
+        self.rsi_sell_var = tk.IntVar(value=70)
+        tk.Entry(prm_frame, textvariable=self.rsi_sell_var, width=6).grid(row=4, column=1, padx=6)
+
+        self.predict_btn = tk.Button(left_panel, text="🔮 Compute Signals", bg='#f39c12', fg='white',
+                         font=("Arial", 10, "bold"), width=25, command=self._compute_signals,
+                         cursor="hand2", activebackground='#d78a0f')
+        self.predict_btn.pack(pady=(8, 5))
+        
+        # Right panel: output
+        right_panel = tk.Frame(main_frame, bg='white', relief=tk.RIDGE, bd=1)
+        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        # Use a Notebook so we can show both textual output and generated visuals
+        tk.Label(right_panel, text="Output & Results", font=("Arial", 10, "bold"), bg='white').pack(anchor=tk.W, padx=10, pady=(10, 5))
+        self.right_notebook = ttk.Notebook(right_panel)
+        self.right_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Text output tab
+        out_tab = tk.Frame(self.right_notebook, bg='white')
+        self.output = scrolledtext.ScrolledText(out_tab, font=("Courier", 9), bg='#f8f9fa',
+                               fg='#2c3e50', height=30, wrap=tk.WORD)
+        self.output.pack(fill=tk.BOTH, expand=True)
+        self.right_notebook.add(out_tab, text='Output')
+
+        # Visuals tab
+        vis_tab = tk.Frame(self.right_notebook, bg='white')
+        vis_frame = tk.Frame(vis_tab, bg='white')
+        vis_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Left: list of images
+        img_list_frame = tk.Frame(vis_frame, bg='white')
+        img_list_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10), pady=5)
+        tk.Label(img_list_frame, text='Visuals', bg='white', font=("Arial", 9, 'bold')).pack(anchor=tk.N)
+        self.image_listbox = tk.Listbox(img_list_frame, height=20, width=30)
+        self.image_listbox.pack(fill=tk.Y, expand=False)
+        self.image_listbox.bind('<<ListboxSelect>>', self._on_image_select)
+
+        # Right: image / JSON display container
+        img_display_frame = tk.Frame(vis_frame, bg='white')
+        img_display_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        self.visual_display_container = img_display_frame
+
+        # Image label (for PNGs)
+        self.image_label = tk.Label(img_display_frame, bg='white')
+        self.image_label.pack(fill=tk.BOTH, expand=True)
+
+        # JSON/text display (hidden by default)
+        self.json_text = scrolledtext.ScrolledText(img_display_frame, font=("Courier", 10), bg='#ffffff', wrap=tk.NONE)
+        self.json_text.pack(fill=tk.BOTH, expand=True)
+        self.json_text.pack_forget()
+
+        self.right_notebook.add(vis_tab, text='Visuals')
+
+        # Storage for loaded images to prevent GC
+        self._tk_images = {}
+        
+        # Footer
+        footer_frame = tk.Frame(self.root, bg='#ecf0f1', height=40)
+        footer_frame.pack(fill=tk.X)
+        
+        status_text = "Ready. Fetch live data from Yahoo Finance, analyze, and export to Looker dashboards."
+        self.status_label = tk.Label(footer_frame, text=status_text, font=("Arial", 9), bg='#ecf0f1', fg='#7f8c8d', pady=10)
+        self.status_label.pack(side=tk.LEFT, padx=10)
+        
+        # Log initial message
+        self._log("=== BigQuery Analytics Pipeline ===")
+        self._log(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._log("Ready to fetch live stock data from Yahoo Finance.")
+        self._log("")
+    
+    def _ui(self, fn):
+        """Marshal a widget update onto the Tk main thread.
+
+        Worker threads must never touch Tk widgets directly; everything goes
+        through root.after so the event loop is the single writer.
+        """
+        self.root.after(0, fn)
+
+    def _log(self, message):
+        """Queue a log message; messages are flushed in batches by a timer."""
+        self._log_queue.append(message)
+        if self._log_drain_job is None:
+            self._log_drain_job = self.root.after(50, self._drain_log)
+
+    def _drain_log(self):
+        """Insert all pending log lines in one write and flush pending draws."""
+        self._log_drain_job = None
+        if not self._log_queue:
+            return
+        batch = []
+        while self._log_queue:
+            batch.append(self._log_queue.popleft())
+        self.output.insert(tk.END, "\n".join(batch) + "\n")
+        self.output.see(tk.END)
+        self.output.update_idletasks()
+
+    def _write_json(self, obj, path):
+        """Serialize a dashboard dict to disk, preferring orjson if installed."""
+        if ORJSON_AVAILABLE:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(obj, f, indent=2)
+    
+    def _fetch_data(self):
+        """Fetch live data from Yahoo Finance in background thread."""
+        if self.is_running:
+            messagebox.showwarning("Running", "Another operation is in progress.")
+            return
+        
+        threading.Thread(target=self._fetch_data_thread, daemon=True).start()
+    
+    def _fetch_data_thread(self):
+        """Background thread for fetching data."""
+        self.is_running = True
+        self._ui(lambda: self.fetch_btn.config(state=tk.DISABLED, bg='#95a5a6'))
+        
+        try:
+            self._log("\n" + "="*50)
+            self._log("📊 FETCHING LIVE DATA FROM YAHOO FINANCE")
+            self._log("="*50)
+            
+            symbols = [s.strip().upper() for s in self.symbols_entry.get().split(',')]
+            period = self.period_var.get()
+            
+            self._log(f"Symbols: {', '.join(symbols)}")
+            self._log(f"Period: {period}")
+            self._log("Fetching prices...")
+            
+            # Fetch data
+            df = fetch_yfinance_prices(symbols, period=period, interval='1d')
+            
+            if df.empty:
+                self._log("❌ Error: No data returned from Yahoo Finance.")
+                self._ui(lambda: messagebox.showerror("Error", "Failed to fetch data from Yahoo Finance."))
+                self.is_running = False
+                self._ui(lambda: self.fetch_btn.config(state=tk.NORMAL, bg='#27ae60'))
+                return
+            
+            self._log(f"✓ Fetched {len(df)} records")
+            self._log(f"Date range: {df['date'].min()} to {df['date'].max()}")
+            self._log(f"Symbols found: {', '.join(df['symbol'].unique())}")
+            
+            # Compute indicators
+            self._log("Computing technical indicators (SMA, RSI)...")
+            df = compute_basic_indicators(df)
+            self._log("✓ Indicators computed")
+            
+            # Save to Parquet (fast columnar format), with CSV kept for legacy tools
+            self._log("Saving data...")
+            csv_path = os.path.join(os.path.dirname(__file__), 'data', 'stock_prices.csv')
+            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+            parquet_path = csv_path.replace('.csv', '.parquet')
+            try:
+                df.to_parquet(parquet_path, compression='snappy', index=False)
+                self._log(f"✓ Data saved to {parquet_path}")
+            except (ImportError, ValueError) as e:
+                self._log(f"⚠️ Parquet write skipped (pyarrow not available?): {e}")
+            # Legacy CSV, gzip-compressed and streamed in chunks so the
+            # encoder never materializes the whole file in memory
+            csv_gz_path = csv_path + '.gz'
+            df.to_csv(csv_gz_path, index=False, chunksize=10_000, compression='gzip')
+            self._log(f"✓ Data saved to {csv_gz_path}")
+            
+            # Generate SQL load script
+            self._log("Generating SQL load script...")
+            sql_path = os.path.join(os.path.dirname(__file__), 'sql', 'load_stock_prices.sql')
+            self._generate_sql_load(df, sql_path)
+            self._log(f"✓ SQL script generated at {sql_path}")
+            
+            # Normalize the date column to datetime64 exactly once; every
+            # downstream pass can rely on the dtype from here on
+            df['date'] = pd.to_datetime(df['date'], cache=True)
+
+            # Store reference for analytics, pre-indexed by symbol
+            self.last_data = df
+            self.symbol_groups = {sym: g.sort_values('date')
+                                  for sym, g in df.groupby('symbol', sort=False)}
+            self.latest_per_symbol = (df.sort_values(['symbol', 'date'])
+                                      .groupby('symbol', sort=False).tail(1)
+                                      .set_index('symbol'))
+            
+            self._log("\n✅ Live data fetch complete!")
+            self._log("Next: Click 'Run Analytics' to analyze the data.")
+            self._ui(lambda: self.analyze_btn.config(state=tk.NORMAL, bg='#3498db'))
+            self._update_status("✓ Data fetched. Ready for analysis.")
+
+        except Exception as e:
+            self._log(f"\n❌ Error fetching data: {str(e)}")
+            self._ui(lambda msg=str(e): messagebox.showerror("Error", f"Failed to fetch data:\n{msg}"))
+
+        finally:
+            self.is_running = False
+            self._ui(lambda: self.fetch_btn.config(state=tk.NORMAL, bg='#27ae60'))
+    
+    def _generate_sql_load(self, df, sql_path):
+        """Generate SQL INSERT statements from data."""
+        os.makedirs(os.path.dirname(sql_path), exist_ok=True)
+
+        # Build all VALUES tuples with vectorized string operations instead of
+        # iterating rows in Python - pandas does the formatting in C.
+        sma_20_sql = np.where(df['sma_20'].notna(), df['sma_20'].astype(str), 'NULL') if 'sma_20' in df.columns else np.full(len(df), 'NULL')
+        rsi_14_sql = np.where(df['rsi_14'].notna(), df['rsi_14'].astype(str), 'NULL') if 'rsi_14' in df.columns else np.full(len(df), 'NULL')
+
+        values = (
+            "  ('" + df['date'].astype(str)
+            + "', '" + df['symbol'].astype(str)
+            + "', " + df['open'].astype(str)
+            + ", " + df['high'].astype(str)
+            + ", " + df['low'].astype(str)
+            + ", " + df['close'].astype(str)
+            + ", " + df['volume'].astype('int64').astype(str)
+            + ", " + sma_20_sql
+            + ", " + rsi_14_sql
+            + ", CURRENT_TIMESTAMP())"
+        ).tolist()
+
+        header = (
+            "INSERT INTO `{project}.{dataset}.stock_prices`\n"
+            "  (date, symbol, open, high, low, close, volume, sma_20, rsi_14, fetch_timestamp)\n"
+            "VALUES\n"
+        )
+
+        # One multi-row INSERT per chunk instead of one DML statement per row;
+        # 500 rows per statement keeps each INSERT well within BigQuery limits.
+        chunk_size = 500
+        statements = [
+            header + ",\n".join(values[start:start + chunk_size]) + ";\n"
+            for start in range(0, len(values), chunk_size)
+        ]
+
+        parts = [
+            "-- Auto-generated SQL load script\n",
+            "-- Insert stock prices into BigQuery\n\n",
+            "\n".join(statements),
+            "\n-- Replace {project} and {dataset} with your actual BigQuery project and dataset IDs\n",
+        ]
+
+        # Assemble the whole script in memory and write it in one call
+        with open(sql_path, 'w') as f:
+            f.write("".join(parts))
+    
+    def _run_analytics(self):
+        """Run analytics queries."""
+        if self.is_running:
+            messagebox.showwarning("Running", "Another operation is in progress.")
+            return
+        
+        if self.last_data is None or self.last_data.empty:
+            messagebox.showwarning("No Data", "Please fetch data first.")
+            return
+        
+        threading.Thread(target=self._run_analytics_thread, daemon=True).start()
+    
+    def _run_analytics_thread(self):
+        """Background thread for analytics."""
+        self.is_running = True
+        self._ui(lambda: self.analyze_btn.config(state=tk.DISABLED, bg='#95a5a6'))
+        
+        try:
+            self._log("\n" + "="*50)
+            self._log("📈 RUNNING ANALYTICS")
+            self._log("="*50)
+            
+            df = self.last_data
+            
+            # Local analytics (no BigQuery required) - one groupby pass per
+            # column instead of re-slicing the frame for each symbol.
+            stats = df.groupby('symbol', sort=False).agg(
+                close_mean=('close', 'mean'),
+                close_max=('close', 'max'),
+                close_min=('close', 'min'),
+                close_last=('close', 'last'),
+                vol_mean=('volume', 'mean'),
+                vol_max=('volume', 'max'),
+            )
+
+            self._log("\n1. PRICE STATISTICS")
+            self._log("-" * 40)
+
+            for row in stats.itertuples():
+                self._log(f"\n{row.Index}:")
+                self._log(f"  Latest: ${row.close_last:.2f}")
+                self._log(f"  Average: ${row.close_mean:.2f}")
+                self._log(f"  High: ${row.close_max:.2f}")
+                self._log(f"  Low: ${row.close_min:.2f}")
+
+            # Technical indicators
+            self._log("\n2. TECHNICAL INDICATORS")
+            self._log("-" * 40)
+
+            latest_rows = self.latest_per_symbol
+            if latest_rows is None:
+                latest_rows = df.groupby('symbol', sort=False).tail(1).set_index('symbol')
+
+            # Work on plain ndarrays rather than per-row Series access
+            n_latest = len(latest_rows)
+            sma_arr = (pd.to_numeric(latest_rows['sma_20'], errors='coerce').to_numpy()
+                       if 'sma_20' in latest_rows.columns else np.full(n_latest, np.nan))
+            rsi_arr = (pd.to_numeric(latest_rows['rsi_14'], errors='coerce').to_numpy()
+                       if 'rsi_14' in latest_rows.columns else np.full(n_latest, np.nan))
+
+            for symbol, sma, rsi in zip(latest_rows.index.to_numpy(), sma_arr, rsi_arr):
+                sma_str = f"{sma:.2f}" if np.isfinite(sma) else "N/A"
+                rsi_str = f"{rsi:.2f}" if np.isfinite(rsi) else "N/A"
+
+                self._log(f"{symbol}: SMA(20)={sma_str}, RSI(14)={rsi_str}")
+
+            # Volume analysis
+            self._log("\n3. VOLUME ANALYSIS")
+            self._log("-" * 40)
+
+            for row in stats.itertuples():
+                self._log(f"{row.Index}: Avg Volume={row.vol_mean:,.0f}, Max={row.vol_max:,.0f}")
+            
+            self._log("\n✅ Analytics complete!")
+            self._log("Next: Click 'Export Dashboards' to generate Looker configs.")
+            self._ui(lambda: self.export_btn.config(state=tk.NORMAL, bg='#e74c3c'))
+            self._update_status("✓ Analytics complete. Ready to export dashboards.")
+
+        except Exception as e:
+            self._log(f"\n❌ Error during analytics: {str(e)}")
+            self._ui(lambda msg=str(e): messagebox.showerror("Error", f"Analytics failed:\n{msg}"))
+
+        finally:
+            self.is_running = False
+            self._ui(lambda: self.analyze_btn.config(state=tk.NORMAL, bg='#3498db'))
+    
+    def _export_dashboards(self):
+        """Export Looker dashboards."""
+        if self.is_running:
+            messagebox.showwarning("Running", "Another operation is in progress.")
+            return
+        
+        if self.last_data is None or self.last_data.empty:
+            messagebox.showwarning("No Data", "Please fetch data first.")
+            return
+        
+        threading.Thread(target=self._export_dashboards_thread, daemon=True).start()
+    
+    def _export_dashboards_thread(self):
+        """Background thread for dashboard export."""
+        self.is_running = True
+        self._ui(lambda: self.export_btn.config(state=tk.DISABLED, bg='#95a5a6'))
+        
+        try:
+            self._log("\n" + "="*50)
+            self._log("📊 EXPORTING LOOKER DASHBOARDS")
+            self._log("="*50)
+            
+            # Use provided project/dataset or default to demo values
+            project_id = self.project_entry.get() or "financial-analytics-demo"
+            dataset_id = self.dataset_entry.get() or "financial_data"
+            
+            builder = LookerDashboardBuilder(project_id, dataset_id)
+
+            # Generate visuals (candlesticks, summary charts) and attach to dashboards
+            images_dir = os.path.join(os.path.dirname(__file__), 'looker', 'images')
+            os.makedirs(images_dir, exist_ok=True)
+            try:
+                images = self._generate_visuals(self.last_data, images_dir)
+                self._log(f"✓ Generated {len(images)} visualization images")
+                # Load visuals into GUI (schedule on main thread)
+                try:
+                    self.root.after(100, lambda: self._load_visuals(images_dir))
+                except Exception:
+                    pass
+            except Exception as e:
+                self._log(f"⚠️ Warning: visual generation failed: {e}")
+                images = {}
+            
+            # Stock Performance Dashboard
+            self._log("Generating: Stock Performance Dashboard...")
+            dashboard_stock = builder.create_stock_performance_dashboard()
+            # attach summary image if exists
+            if 'summary' in images:
+                dashboard_stock['image'] = images['summary']
+            stock_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_stock_performance.json')
+            os.makedirs(os.path.dirname(stock_path), exist_ok=True)
+            
+            self._write_json(dashboard_stock, stock_path)
+            self._log(f"✓ Saved: {stock_path}")
+            
+            # Market Analysis Dashboard
+            self._log("Generating: Market Analysis Dashboard...")
+            dashboard_market = builder.create_market_analysis_dashboard()
+            if 'volatility' in images:
+                dashboard_market['image'] = images['volatility']
+            market_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_market_analysis.json')
+            
+            self._write_json(dashboard_market, market_path)
+            self._log(f"✓ Saved: {market_path}")
+            
+            # Portfolio Dashboard
+            self._log("Generating: Portfolio Dashboard...")
+            dashboard_portfolio = builder.create_portfolio_dashboard()
+            if 'portfolio' in images:
+                dashboard_portfolio['image'] = images['portfolio']
+            portfolio_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_portfolio.json')
+            
+            self._write_json(dashboard_portfolio, portfolio_path)
+            self._log(f"✓ Saved: {portfolio_path}")
+            
+            # KPI Dashboard
+            self._log("Generating: KPI Summary Dashboard...")
+            dashboard_kpi = builder.create_kpi_dashboard()
+            if 'kpi' in images:
+                dashboard_kpi['image'] = images['kpi']
+            kpi_path = os.path.join(os.path.dirname(__file__), 'looker', 'dashboard_kpi_summary.json')
+            
+            self._write_json(dashboard_kpi, kpi_path)
+            self._log(f"✓ Saved: {kpi_path}")
+            
+            # LookML Views (use LookMLGenerator)
+            self._log("Generating: LookML Views...")
+            generator = LookMLGenerator(project_id, dataset_id)
+            stock_view = generator.generate_stock_prices_view()
+            view_path = os.path.join(os.path.dirname(__file__), 'looker', 'stock_prices.view.lkml')
+            
+            with open(view_path, 'w') as f:
+                f.write(stock_view)
+            self._log(f"✓ Saved: {view_path}")
+            
+            self._log("\n✅ All dashboards exported successfully!")
+            self._log("Check the 'looker/' directory for JSON files and LookML views.")
+            self._update_status("✓ Dashboards exported. Project complete!")
+            
+        except Exception as e:
+            self._log(f"\n❌ Error exporting dashboards: {str(e)}")
+            self._ui(lambda msg=str(e): messagebox.showerror("Error", f"Dashboard export failed:\n{msg}"))
+
+        finally:
+            self.is_running = False
+            self._ui(lambda: self.export_btn.config(state=tk.NORMAL, bg='#e74c3c'))
+    
+    def _clear_results(self):
+        """Clear output and reset state."""
+        self.output.delete(1.0, tk.END)
+        self.analyze_btn.config(state=tk.DISABLED, bg='#95a5a6')
+        self.export_btn.config(state=tk.DISABLED, bg='#95a5a6')
+        self._log("=== BigQuery Analytics Pipeline ===")
+        self._log(f"Reset: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._log("Ready to fetch live stock data from Yahoo Finance.")
+        self._update_status("Ready.")
+    
+    def _generate_visuals(self, df: pd.DataFrame, out_dir: str) -> dict:
+        """Generate visualizations (candlestick, summary, volatility, kpi) and save PNGs.
+
+        Returns dict mapping keys to relative image paths.
+        """
+        images = {}
+        if df is None or df.empty:
+            return images
+
+        self._rgba_buffers.clear()
+        # The date column is normalized to datetime64 at fetch time
+        df = df.copy()
+
+        # Reuse the per-symbol groups built at fetch time when available;
+        # otherwise build them once here instead of slicing per symbol
+        groups = self.symbol_groups or {sym: g.sort_values('date')
+                                        for sym, g in df.groupby('symbol', sort=False)}
+
+        # Summary: multiple lines of close prices
+        try:
+            fig = Figure(figsize=(10, 4))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
+            for sym, s in groups.items():
+                ax.plot(s['date'], s['close'], label=sym, linewidth=1.1)
+            ax.set_title('Market Close Prices')
+            ax.set_xlabel('Date')
+            ax.set_ylabel('Close')
+            ax.legend(loc='upper left')
+            summary_path = os.path.join(out_dir, 'market_summary.png')
+            fig.tight_layout()
+            fig.savefig(summary_path)
+            self._capture_rgba(fig, summary_path)
+            images['summary'] = os.path.relpath(summary_path, os.path.dirname(__file__))
+        except Exception:
+            pass
+
+        # Volatility chart - std of per-symbol log returns, computed in one
+        # groupby pass over a precomputed log-price column
+        try:
+            df['log_close'] = np.log(df['close'].to_numpy())
+            vol = df.groupby('symbol', sort=False)['log_close'].agg(
+                lambda s: np.diff(s.to_numpy()).std())
+            fig = Figure(figsize=(6, 3))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
+            ax.bar(vol.index, vol.to_numpy(), color='orange')
+            ax.set_title('Volatility by Symbol')
+            vol_path = os.path.join(out_dir, 'volatility.png')
+            fig.tight_layout()
+            fig.savefig(vol_path)
+            self._capture_rgba(fig, vol_path)
+            images['volatility'] = os.path.relpath(vol_path, os.path.dirname(__file__))
+        except Exception:
+            pass
+
+        # KPI summary image (simple text panel)
+        try:
+            if self.latest_per_symbol is not None:
+                latest = self.latest_per_symbol.reset_index()
+            else:
+                latest = df.sort_values(['symbol', 'date']).groupby('symbol').tail(1)
+            kpi_fig = Figure(figsize=(6, 2))
+            FigureCanvasAgg(kpi_fig)
+            kpi_ax = kpi_fig.add_subplot(111)
+            kpi_ax.axis('off')
+            lines = []
+            for _, r in latest.iterrows():
+                lines.append(f"{r['symbol']}: {r['close']:.2f}")
+            kpi_ax.text(0.01, 0.98, '\n'.join(lines), va='top', fontsize=10, family='monospace')
+            kpi_path = os.path.join(out_dir, 'kpi_summary.png')
+            kpi_fig.tight_layout()
+            kpi_fig.savefig(kpi_path)
+            self._capture_rgba(kpi_fig, kpi_path)
+            images['kpi'] = os.path.relpath(kpi_path, os.path.dirname(__file__))
+        except Exception:
+            pass
+
+        # Candlesticks per symbol (save up to 6 symbols). Wicks and bodies are
+        # drawn as single collections so matplotlib renders each chart in one
+        # pass instead of creating one artist per bar.
+        try:
+            symbols = list(groups)[:6]
+            # Chart rendering is CPU-bound and independent per symbol, so fan
+            # it out to worker processes; fall back to a serial loop if the
+            # pool cannot start (e.g. restricted environments).
+            frames = [groups[sym] for sym in symbols]
+            try:
+                workers = min(os.cpu_count() or 1, len(symbols))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_render_candlestick, symbols, frames,
+                                            [out_dir] * len(symbols)))
+            except Exception:
+                results = [_render_candlestick(sym, s, out_dir)
+                           for sym, s in zip(symbols, frames)]
+            for sym, rel_path, fname, rgba in results:
+                images[f'candle_{sym}'] = rel_path
+                if rgba is not None:
+                    self._rgba_buffers[fname] = rgba
+        except Exception:
+            pass
+
+        return images
+
+    def _capture_rgba(self, fig, path):
+        """Stash the rendered figure's RGBA buffer, keyed by PNG basename.
+
+        Lets the visuals tab build Tk images straight from memory instead of
+        re-decoding the PNG that was just written.
+        """
+        try:
+            fig.canvas.draw()
+            self._rgba_buffers[os.path.basename(path)] = np.asarray(fig.canvas.buffer_rgba()).copy()
+        except Exception:
+            pass
+
+    def _load_visuals(self, images_dir: str):
+        """Load images from `images_dir` into the visuals tab listbox."""
+        try:
+            if not os.path.isdir(images_dir):
+                return
+
+            files = [f for f in os.listdir(images_dir) if f.lower().endswith('.png')]
+            files.sort()
+
+            # Clear listbox
+            self.image_listbox.delete(0, tk.END)
+            self._tk_images.clear()
+            self._thumb_cache.clear()
+
+            # also include JSON and LookML files
+            extra = [f for f in os.listdir(os.path.dirname(images_dir)) if f.lower().endswith(('.json', '.lkml'))]
+            items = files + extra
+
+            for fname in items:
+                full = os.path.join(images_dir, fname) if fname in files else os.path.join(os.path.dirname(images_dir), fname)
+                display_name = fname
+                self.image_listbox.insert(tk.END, display_name)
+
+                # Thumbnails are decoded lazily on first selection, so
+                # populating the list stays O(1) per entry
+                ftype = 'png' if fname.lower().endswith('.png') else ('json' if fname.lower().endswith('.json') else 'lkml')
+                self._tk_images[display_name] = (full, ftype, None, 0)
+                if ftype == 'png' and PIL_AVAILABLE:
+                    self._prefetch_thumb(display_name, full)
+
+            # If at least one image, select the first
+            if items:
+                self.image_listbox.selection_set(0)
+                self._show_image_by_name(items[0])
+        except Exception:
+            pass
+
+    def _thumb_cache_path(self, full):
+        """On-disk cache location for a source image's thumbnail.
+
+        Keyed by path + mtime + size so edits invalidate the entry without
+        hashing the file contents.
+        """
+        try:
+            st = os.stat(full)
+            key = hashlib.blake2b(f"{full}|{st.st_mtime_ns}|{st.st_size}".encode(),
+                                  digest_size=16).hexdigest()
+            cache_dir = os.path.join(os.path.expanduser('~'), '.cache',
+                                     'bq-analytics-pipeline', 'thumbs')
+            os.makedirs(cache_dir, exist_ok=True)
+            return os.path.join(cache_dir, key + '.png')
+        except OSError:
+            return None
+
+    def _decode_thumb(self, full, fname):
+        """Decode and downsample one image to a PIL Image.
+
+        Safe to run on a worker thread; only the PhotoImage conversion must
+        happen on the Tk main thread.
+        """
+        rgba = self._rgba_buffers.get(fname)
+        if rgba is not None:
+            # Freshly rendered this session: build the image from the
+            # Agg RGBA buffer, no PNG decode needed
+            img = Image.fromarray(rgba)
+            img.thumbnail((900, 600), Image.LANCZOS)
+            return img
+
+        cache_path = self._thumb_cache_path(full)
+        if cache_path and os.path.exists(cache_path):
+            # Cached thumbnails are already downsampled
+            return Image.open(cache_path)
+
+        if PYVIPS_AVAILABLE:
+            # libvips shrinks during the PNG/JPEG load itself, so the full
+            # resolution image never has to be decoded into memory
+            vi = pyvips.Image.thumbnail(full, 900, height=600)
+            if vi.hasalpha():
+                vi = vi.flatten(background=[255, 255, 255])
+            img = Image.frombuffer('RGB', (vi.width, vi.height),
+                                   vi.write_to_memory(), 'raw', 'RGB', 0, 1)
+        else:
+            # Downscale during decode where the codec allows it
+            img = Image.open(full)
+            img.draft('RGB', (900, 600))
+            img.thumbnail((900, 600), Image.LANCZOS)
+        if cache_path:
+            try:
+                img.save(cache_path, 'PNG', optimize=True)
+            except Exception:
+                pass
+        return img
+
+    def _make_thumb(self, full, fname):
+        """Decode and downsample one image, preferring the in-memory RGBA buffer."""
+        try:
+            if not PIL_AVAILABLE:
+                return tk.PhotoImage(file=full)
+            return ImageTk.PhotoImage(self._decode_thumb(full, fname))
+        except Exception:
+            return None
+
+    def _cache_thumb(self, name, tkimg):
+        """Insert one PhotoImage, evicting the least recently viewed."""
+        self._thumb_cache[name] = tkimg
+        self._thumb_cache.move_to_end(name)
+        while len(self._thumb_cache) > self._thumb_cache_max:
+            self._thumb_cache.popitem(last=False)
+
+    def _get_thumb(self, name, full):
+        """Fetch a thumbnail from the LRU cache, decoding on miss."""
+        tkimg = self._thumb_cache.get(name)
+        if tkimg is not None:
+            self._thumb_cache.move_to_end(name)
+            return tkimg
+        tkimg = self._make_thumb(full, name)
+        if tkimg is not None:
+            self._cache_thumb(name, tkimg)
+        return tkimg
+
+    def _install_thumb(self, name, img):
+        """Wrap a decoded PIL Image in a PhotoImage and cache it (main thread)."""
+        if name in self._thumb_cache or name not in self._tk_images:
+            return
+        try:
+            self._cache_thumb(name, ImageTk.PhotoImage(img))
+        except Exception:
+            pass
+
+    def _prefetch_thumb(self, name, full):
+        """Decode a thumbnail on the worker pool and install it via the Tk loop."""
+        def _done(fut):
+            if fut.exception() is None:
+                self.root.after(0, self._install_thumb, name, fut.result())
+
+        self._thumb_pool.submit(self._decode_thumb, full, name).add_done_callback(_done)
+
+    def _show_image_by_name(self, name: str):
+        entry = self._tk_images.get(name)
+        if not entry:
+            return
+        full, ftype, pretty, mtime = entry
+        # stop other animations
+        self._stop_image_pulse()
+        self._stop_json_scroll()
+
+        if ftype == 'png':
+            # show image widget
+            self.json_text.pack_forget()
+            self.image_label.pack(fill=tk.BOTH, expand=True)
+            tkimg = self._get_thumb(name, full)
+            if tkimg:
+                self.image_label.config(image=tkimg, text='')
+                self.image_label.image = tkimg
+            else:
+                self.image_label.config(image='', text=full)
+
+            # start a gentle pulse to draw attention
+            self._start_image_pulse()
+        else:
+            # show JSON/LKML in text view
+            self.image_label.pack_forget()
+            self.json_text.pack(fill=tk.BOTH, expand=True)
+            try:
+                self.json_text.delete(1.0, tk.END)
+                # Invalidate any stream still running for a previous selection
+                self._text_token += 1
+                # Re-rendering pretty JSON per click is wasted parse + dump;
+                # reuse the cached text while the file is unchanged on disk
+                st_mtime = os.stat(full).st_mtime_ns
+                if pretty is not None and st_mtime == mtime:
+                    self.json_text.insert(tk.END, pretty)
+                    self.json_text.see('1.0')
+                    # start auto-scroll animation
+                    self._start_json_scroll()
+                else:
+                    # Read and render off the Tk thread so multi-MB files do
+                    # not freeze the UI
+                    threading.Thread(target=self._stream_text,
+                                     args=(name, full, ftype, st_mtime, self._text_token),
+                                     daemon=True).start()
+            except Exception:
+                self.json_text.delete(1.0, tk.END)
+                self.json_text.insert(tk.END, f"Failed to open {full}")
+
+    def _append_text(self, token, chunk):
+        """Append one streamed chunk, unless the selection has moved on."""
+        if token == self._text_token:
+            self.json_text.insert(tk.END, chunk)
+
+    def _finish_text(self, name, ftype, pretty, st_mtime, token, inserted=False):
+        """Cache rendered text and finish the view (main thread)."""
+        entry = self._tk_images.get(name)
+        if entry:
+            full = entry[0]
+            self._tk_images[name] = (full, ftype, pretty, st_mtime)
+        if token != self._text_token:
+            return
+        if not inserted:
+            self.json_text.insert(tk.END, pretty)
+        self.json_text.see('1.0')
+        # start auto-scroll animation
+        self._start_json_scroll()
+
+    def _stream_text(self, name, full, ftype, st_mtime, token):
+        """Load a JSON/LKML file on a worker thread and feed the text view.
+
+        LKML streams into the widget in 64KB chunks; JSON buffers the whole
+        document (the pretty-printer needs it) and inserts once.
+        """
+        try:
+            if ftype == 'json':
+                with open(full, 'rb') as fh:
+                    content = fh.read()
+                # try pretty JSON if possible (orjson parses and dumps in C)
+                try:
+                    if ORJSON_AVAILABLE:
+                        pretty = orjson.dumps(orjson.loads(content),
+                                              option=orjson.OPT_INDENT_2).decode()
+                    else:
+                        pretty = json.dumps(json.loads(content), indent=2)
+                except Exception:
+                    pretty = content.decode('utf-8', errors='replace')
+                self.root.after(0, self._finish_text, name, ftype, pretty, st_mtime, token)
+            else:
+                parts = []
+                with open(full, 'r', encoding='utf-8') as fh:
+                    while True:
+                        chunk = fh.read(65536)
+                        if not chunk:
+                            break
+                        parts.append(chunk)
+                        self.root.after(0, self._append_text, token, chunk)
+                self.root.after(0, self._finish_text, name, ftype, ''.join(parts),
+                                st_mtime, token, True)
+        except Exception:
+            self._ui(lambda: self._append_text(token, f"Failed to open {full}"))
+
+    def _on_image_select(self, _event=None):
+        try:
+            sel = self.image_listbox.curselection()
+            if not sel:
+                return
+            idx = sel[0]
+            name = self.image_listbox.get(idx)
+            self._show_image_by_name(name)
+        except Exception:
+            pass
+
+    def _refresh_visuals(self):
+        images_dir = os.path.join(os.path.dirname(__file__), 'looker', 'images')
+        self._load_visuals(images_dir)
+
+    # --- Animations: image pulse and JSON auto-scroll ---
+    # One after() chain at 120ms drives both effects; the pulse fires every
+    # 5 ticks (600ms) and the scroll every 10 ticks (1200ms), so the event
+    # loop wakes once per tick instead of once per animation.
+    TICK_MS = 120
+
+    def _ensure_tick(self):
+        try:
+            if (self._tick_job is None and not self._anim_paused
+                    and (self._pulse_active or self._scroll_active)):
+                self._tick_job = self.root.after(self.TICK_MS, self._tick)
+        except Exception:
+            pass
+
+    def _cancel_tick(self):
+        try:
+            if self._tick_job is not None:
+                self.root.after_cancel(self._tick_job)
+                self._tick_job = None
+        except Exception:
+            pass
+
+    def _tick(self):
+        self._tick_job = None
+        try:
+            self._tick_count += 1
+            if self._pulse_active and self._tick_count % 5 == 0:
+                self._pulse_state = not self._pulse_state
+                color = '#ffffff' if self._pulse_state else '#f7f1ff'
+                self.image_label.config(bg=color)
+            if self._scroll_active and self._tick_count % 10 == 0:
+                self.json_text.yview_scroll(1, 'pages')
+        except Exception:
+            pass
+        self._ensure_tick()
+
+    def _pause_animations(self, _event=None):
+        self._anim_paused = True
+        self._cancel_tick()
+
+    def _resume_animations(self, _event=None):
+        self._anim_paused = False
+        self._ensure_tick()
+
+    def _start_image_pulse(self):
+        try:
+            self._pulse_state = False
+            self._pulse_active = True
+            self._ensure_tick()
+        except Exception:
+            pass
+
+    def _stop_image_pulse(self):
+        try:
+            if self._pulse_active:
+                self._pulse_active = False
+                self.image_label.config(bg='white')
+            if not self._scroll_active:
+                self._cancel_tick()
+        except Exception:
+            pass
+
+    def _start_json_scroll(self):
+        try:
+            self._scroll_active = True
+            self._ensure_tick()
+        except Exception:
+            pass
+
+    def _stop_json_scroll(self):
+        try:
+            self._scroll_active = False
+            if not self._pulse_active:
+                self._cancel_tick()
+        except Exception:
+            pass
+
+    def _compute_signals(self):
+        """Run signal computation in background."""
+        if self.is_running:
+            messagebox.showwarning("Running", "Another operation is in progress.")
+            return
+
+        if self.last_data is None or self.last_data.empty:
+            messagebox.showwarning("No Data", "Please fetch data first.")
+            return
+
+        threading.Thread(target=self._compute_signals_thread, daemon=True).start()
+
+    def _calculate_rsi(self, series: pd.Series, period: int = 14) -> pd.Series:
+        rsi = _rsi_kernel(series.to_numpy(dtype=np.float64), period)
+        return pd.Series(rsi, index=series.index)
+
+    def _compute_signals_thread(self):
+        """Compute simple SMA crossover + RSI-based buy/hold/sell signals."""
+        try:
+            self._log("\n🔮 Computing buy/sell signals...")
+            df = self.last_data.copy()
+            sma_short = max(2, int(self.sma_short_var.get()))
+            sma_long = max(sma_short + 1, int(self.sma_long_var.get()))
+            rsi_period = max(2, int(self.rsi_period_var.get()))
+            rsi_buy = int(self.rsi_buy_var.get())
+            rsi_sell = int(self.rsi_sell_var.get())
+
+            # Sort once, then slice contiguous per-symbol views out of one
+            # flat close array via groupby().indices — no per-symbol mask
+            # scan, sort or copy.
+            df = df.sort_values(['symbol', 'date'], kind='mergesort')
+            groups = df.groupby('symbol', sort=False).indices
+            close_all = df['close'].to_numpy(dtype=np.float64)
+
+            min_rows = max(sma_long, rsi_period) + 1
+            syms = []
+            stats = []
+            for sym, idx in groups.items():
+                close = close_all[idx[0]:idx[-1] + 1]
+                if close.shape[0] < min_rows:
+                    continue
+                # The crossover check only reads the last two SMA values, so
+                # average the tail windows directly (O(W) per symbol) instead
+                # of materializing the full rolling series
+                last_s = close[-sma_short:].mean()
+                prev_s = close[-sma_short - 1:-1].mean()
+                last_l = close[-sma_long:].mean()
+                prev_l = close[-sma_long - 1:-1].mean()
+                rsi = _rsi_kernel(close, rsi_period)
+                syms.append(sym)
+                stats.append((last_s, last_l, prev_s, prev_l, rsi[-1]))
+
+            per_sym = {}
+            if syms:
+                last_s, last_l, prev_s, prev_l, last_rsi = np.array(stats).T
+
+                # Encode BUY=+1 / HOLD=0 / SELL=-1 so the combination rule
+                # ("BUY if any BUY and no SELL, ...") is just the sign of the
+                # sum — no string comparisons or branches per symbol
+                sma_int = (((last_s > last_l) & (prev_s <= prev_l)).astype(np.int8)
+                           - ((last_s < last_l) & (prev_s >= prev_l)).astype(np.int8))
+                rsi_int = ((last_rsi <= rsi_buy).astype(np.int8)
+                           - (last_rsi >= rsi_sell).astype(np.int8))
+                labels = np.array(['SELL', 'HOLD', 'BUY'])
+                sma_signal = labels[sma_int + 1]
+                rsi_signal = labels[rsi_int + 1]
+                final = labels[np.sign(sma_int + rsi_int) + 1]
+
+                for i, sym in enumerate(syms):
+                    note = f"SMA:{sma_signal[i]} RSI:{rsi_signal[i]} (rsi={last_rsi[i]:.1f})"
+                    per_sym[sym] = (final[i], note)
+
+            results = []
+            for sym in groups:
+                sig, note = per_sym.get(sym, ('HOLD', 'insufficient data'))
+                results.append((sym, sig, note))
+
+            # Print results
+            self._log('\nSignal Results:')
+            for sym, sig, note in results:
+                self._log(f"  {sym}: {sig} — {note}")
+
+            self._update_status("✓ Signals computed")
+        except Exception as e:
+            self._log(f"\n❌ Error computing signals: {e}")
+        finally:
+            pass
+
+    def _update_status(self, message):
+        """Update status bar (safe to call from worker threads)."""
+        self._ui(lambda: self.status_label.config(text=message))
+
+
+def main():
+    """Main entry point."""
+    root = tk.Tk()
+    app = AnalyticsPipelineApp(root)
+    root.mainloop()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,287 +1,481 @@
-"""
-Data ingestion module for loading financial data into BigQuery.
-Handles sample data generation and streaming/batch loading.
-"""
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
-import logging
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-
-class DataGenerator:
-    """Generates realistic financial market data for testing and demo purposes."""
-    
-    def __init__(self, seed: int = 42):
-        np.random.seed(seed)
-        self.symbols = ["AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "META", "NVDA", "JPM"]
-        self.exchanges = ["NASDAQ", "NYSE"]
-        self.sectors = {"AAPL": "Technology", "GOOGL": "Technology", "MSFT": "Technology",
-                       "AMZN": "Consumer", "TSLA": "Automotive", "META": "Technology",
-                       "NVDA": "Technology", "JPM": "Finance"}
-    
-    def generate_stock_prices(self, days: int = 90) -> pd.DataFrame:
-        """Generate historical stock price data (OHLC)."""
-        records = []
-        base_date = datetime.now().date() - timedelta(days=days)
-        
-        # Initialize price for each symbol
-        base_prices = {symbol: np.random.uniform(50, 500) for symbol in self.symbols}
-        
-        for day_offset in range(days):
-            current_date = base_date + timedelta(days=day_offset)
-            
-            # Skip weekends
-            if current_date.weekday() >= 5:
-                continue
-            
-            for symbol in self.symbols:
-                base_price = base_prices[symbol]
-                
-                # Generate realistic OHLC data with slight daily variation
-                daily_return = np.random.normal(0.0005, 0.02)
-                open_price = base_price * (1 + daily_return)
-                
-                # High and low around open
-                high = open_price * (1 + abs(np.random.normal(0, 0.01)))
-                low = open_price * (1 - abs(np.random.normal(0, 0.01)))
-                close = np.random.uniform(low, high)
-                
-                # Adjust base price for next day
-                base_prices[symbol] = close
-                
-                volume = int(np.random.uniform(1_000_000, 100_000_000))
-                
-                records.append({
-                    "date": current_date,
-                    "symbol": symbol,
-                    "open": round(open_price, 2),
-                    "high": round(high, 2),
-                    "low": round(low, 2),
-                    "close": round(close, 2),
-                    "volume": volume,
-                    "adjusted_close": round(close * 0.99, 2),  # Simplified adjustment
-                })
-        
-        return pd.DataFrame(records)
-    
-    def generate_market_trades(self, stock_prices_df: pd.DataFrame, trades_per_day: int = 500) -> pd.DataFrame:
-        """Generate individual trade transactions."""
-        records = []
-        trade_id_counter = 1
-        
-        for _, row in stock_prices_df.iterrows():
-            date = row["date"]
-            symbol = row["symbol"]
-            price_range = (row["low"], row["high"])
-            
-            for _ in range(trades_per_day):
-                # Random trade time during market hours (9:30 AM - 4:00 PM ET)
-                hour = np.random.randint(9, 16)
-                minute = np.random.randint(0, 59)
-                second = np.random.randint(0, 59)
-                
-                timestamp = datetime.combine(date, datetime.min.time().replace(hour=hour, minute=minute, second=second))
-                
-                # Trade price within day range
-                trade_price = np.random.uniform(*price_range)
-                quantity = int(np.random.lognormal(10, 1.5))  # Lognormal for realistic volume
-                side = np.random.choice(["BUY", "SELL"])
-                
-                records.append({
-                    "trade_id": f"TRADE_{trade_id_counter:010d}",
-                    "timestamp": timestamp,
-                    "date": date,
-                    "symbol": symbol,
-                    "price": round(trade_price, 2),
-                    "quantity": quantity,
-                    "side": side,
-                    "trade_value": round(trade_price * quantity, 2),
-                    "exchange": np.random.choice(self.exchanges),
-                })
-                trade_id_counter += 1
-        
-        return pd.DataFrame(records)
-    
-    def generate_market_metrics(self, stock_prices_df: pd.DataFrame, trades_df: pd.DataFrame) -> pd.DataFrame:
-        """Generate aggregated market metrics and technical indicators."""
-        records = []
-        
-        # Group by date and symbol
-        for (date, symbol), group in stock_prices_df.groupby(["date", "symbol"]):
-            row = group.iloc[0]
-            
-            # Filter trades for this date and symbol
-            trades = trades_df[(trades_df["date"] == date) & (trades_df["symbol"] == symbol)]
-            
-            if len(trades) == 0:
-                continue
-            
-            # Calculate metrics
-            avg_price = (row["open"] + row["close"] + row["high"] + row["low"]) / 4
-            price_range = row["high"] - row["low"]
-            volatility = np.random.uniform(0.01, 0.05)  # Simplified
-            
-            buy_volume = trades[trades["side"] == "BUY"]["quantity"].sum()
-            sell_volume = trades[trades["side"] == "SELL"]["quantity"].sum()
-            total_volume = buy_volume + sell_volume
-            
-            buy_sell_ratio = buy_volume / sell_volume if sell_volume > 0 else 0
-            price_change_pct = ((row["close"] - row["open"]) / row["open"] * 100) if row["open"] > 0 else 0
-            
-            records.append({
-                "date": date,
-                "symbol": symbol,
-                "avg_price": round(avg_price, 2),
-                "price_range": round(price_range, 2),
-                "volatility": round(volatility, 4),
-                "total_volume": total_volume,
-                "buy_volume": buy_volume,
-                "sell_volume": sell_volume,
-                "buy_sell_ratio": round(buy_sell_ratio, 2),
-                "price_change_pct": round(price_change_pct, 2),
-                "sma_20": None,  # Would be calculated with more historical data
-                "sma_50": None,
-                "rsi_14": round(np.random.uniform(30, 70), 2),  # Simplified
-                "market_cap_change": round(np.random.uniform(-10, 10), 2),
-            })
-        
-        return pd.DataFrame(records)
-    
-    def generate_portfolio_transactions(self, num_transactions: int = 1000) -> pd.DataFrame:
-        """Generate user portfolio transaction history."""
-        records = []
-        
-        base_date = datetime.now().date() - timedelta(days=180)
-        portfolio_ids = [f"PORT_{i:06d}" for i in range(1, 51)]  # 50 portfolios
-        
-        for i in range(num_transactions):
-            date = base_date + timedelta(days=np.random.randint(0, 180))
-            symbol = np.random.choice(self.symbols)
-            transaction_type = np.random.choice(["BUY", "SELL", "DIVIDEND"], p=[0.5, 0.4, 0.1])
-            
-            quantity = int(np.random.lognormal(5, 1.2)) if transaction_type != "DIVIDEND" else 0
-            price = np.random.uniform(50, 500)
-            
-            if transaction_type == "DIVIDEND":
-                total_amount = np.random.uniform(100, 5000)
-                quantity = 0
-            else:
-                total_amount = quantity * price
-            
-            records.append({
-                "transaction_id": f"TXN_{i:010d}",
-                "portfolio_id": np.random.choice(portfolio_ids),
-                "date": date,
-                "timestamp": datetime.combine(date, datetime.min.time()),
-                "symbol": symbol,
-                "transaction_type": transaction_type,
-                "quantity": quantity,
-                "price": round(price, 2),
-                "total_amount": round(total_amount, 2),
-                "fees": round(np.random.uniform(0, 50), 2),
-                "sector": self.sectors.get(symbol, "Other"),
-            })
-        
-        return pd.DataFrame(records)
-
-
-class BigQueryDataLoader:
-    """Handles loading data into BigQuery tables."""
-    
-    def __init__(self, client):
-        """
-        Initialize with BigQuery client.
-        
-        Args:
-            client: google.cloud.bigquery.Client instance
-        """
-        self.client = client
-        logger.info("BigQueryDataLoader initialized")
-    
-    def load_dataframe_to_bq(
-        self,
-        dataframe: pd.DataFrame,
-        table_id: str,
-        write_disposition: str = "WRITE_APPEND",
-        job_config_kwargs: Dict[str, Any] = None
-    ) -> None:
-        """
-        Load pandas DataFrame to BigQuery table.
-        
-        Args:
-            dataframe: Pandas DataFrame to load
-            table_id: Fully qualified table ID (project.dataset.table)
-            write_disposition: WRITE_TRUNCATE or WRITE_APPEND
-            job_config_kwargs: Additional job configuration options
-        """
-        from google.cloud.bigquery import LoadJobConfig
-        
-        job_config = LoadJobConfig(write_disposition=write_disposition)
-        
-        if job_config_kwargs:
-            for key, value in job_config_kwargs.items():
-                setattr(job_config, key, value)
-        
-        try:
-            job = self.client.load_table_from_dataframe(
-                dataframe,
-                table_id,
-                job_config=job_config
-            )
-            job.result()  # Wait for job to complete
-            logger.info(f"Loaded {len(dataframe)} rows to {table_id}")
-        except Exception as e:
-            logger.error(f"Failed to load data to {table_id}: {str(e)}")
-            raise
-    
-    def create_tables_if_not_exist(self, dataset_id: str, schemas: Dict[str, Any]) -> None:
-        """
-        Create BigQuery tables if they don't exist.
-        
-        Args:
-            dataset_id: Dataset ID
-            schemas: Dictionary of schema definitions
-        """
-        from google.cloud.bigquery import Schema, SchemaField, Table, TimePartitioning, Clustering
-        
-        for schema_name, schema_def in schemas.items():
-            table_id = f"{self.client.project}.{dataset_id}.{schema_def['table_name']}"
-            
-            # Check if table exists
-            try:
-                self.client.get_table(table_id)
-                logger.info(f"Table {table_id} already exists")
-                continue
-            except Exception:
-                pass  # Table doesn't exist, will create it
-            
-            # Build schema
-            schema_fields = [
-                SchemaField(field["name"], field["type"], mode=field.get("mode", "NULLABLE"))
-                for field in schema_def["schema"]
-            ]
-            
-            # Create table
-            table = Table(table_id, schema=Schema(schema_fields))
-            
-            # Add partitioning
-            if "partitioning" in schema_def:
-                partitioning_def = schema_def["partitioning"]
-                table.time_partitioning = TimePartitioning(
-                    type_=partitioning_def["type"],
-                    field=partitioning_def["field"],
-                    expiration_ms=partitioning_def.get("expiration_ms")
-                )
-            
-            # Add clustering
-            if "clustering" in schema_def:
-                clustering_def = schema_def["clustering"]
-                table.clustering_fields = clustering_def["fields"]
-            
-            # Create the table
-            table = self.client.create_table(table)
-            logger.info(f"Created table {table_id}")
+"""
+Data ingestion module for loading financial data into BigQuery.
+Handles sample data generation and streaming/batch loading.
+"""
+import copy
+import functools
+import pandas as pd
+import numpy as np
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Tuple
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# get_table results cached for a short TTL so repeated pipeline runs skip
+# one metadata round-trip per schema
+_TABLE_CACHE: Dict[str, Tuple[float, Any]] = {}
+_TABLE_CACHE_LOCK = threading.RLock()
+_TABLE_CACHE_TTL = 300.0  # seconds
+
+
+def _to_arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a generated frame to pyarrow-backed dtypes when available.
+
+    Generated rows are ultimately shipped to BigQuery; Arrow-backed
+    columns let load_table_from_dataframe serialize Parquet without a
+    second pandas->arrow conversion pass, and dictionary-encode the
+    categorical columns for free. No-op when pyarrow is missing.
+    """
+    try:
+        import pyarrow  # noqa: F401
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+    except Exception:
+        pass
+    return df
+
+
+@functools.lru_cache(maxsize=32)
+def _make_job_config(write_disposition: str, kwargs_frozen: Tuple[Tuple[str, Any], ...]):
+    """Build (and memoize) a Parquet LoadJobConfig for a disposition/kwargs pair.
+
+    Pipelines call load_dataframe_to_bq with the same handful of
+    configurations over and over; caching skips re-parsing the kwargs each
+    time. Callers get a shallow copy so per-job mutation never leaks back
+    into the cache.
+    """
+    from google.cloud.bigquery import LoadJobConfig, SourceFormat
+
+    # Serialize explicitly as snappy Parquet: columnar, compact, and no
+    # schema autodetect pass over CSV/JSON text
+    job_config = LoadJobConfig(
+        write_disposition=write_disposition,
+        source_format=SourceFormat.PARQUET,
+    )
+    for key, value in kwargs_frozen:
+        setattr(job_config, key, value)
+    return job_config
+
+
+class DataGenerator:
+    """Generates realistic financial market data for testing and demo purposes."""
+    
+    def __init__(self, seed: int = 42):
+        # Per-instance PCG64 generator: no global np.random state is
+        # touched, so two DataGenerator(seed) instances are independently
+        # reproducible even when other code draws randomness in between
+        self.rng = np.random.default_rng(seed)
+        self.symbols = ["AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "META", "NVDA", "JPM"]
+        self.exchanges = ["NASDAQ", "NYSE"]
+        self.sectors = {"AAPL": "Technology", "GOOGL": "Technology", "MSFT": "Technology",
+                       "AMZN": "Consumer", "TSLA": "Automotive", "META": "Technology",
+                       "NVDA": "Technology", "JPM": "Finance"}
+    
+    def generate_stock_prices(self, days: int = 90) -> pd.DataFrame:
+        """Generate historical stock price data (OHLC)."""
+        base_date = datetime.now().date() - timedelta(days=days)
+
+        # Trading calendar: skip weekends
+        dates = [base_date + timedelta(days=offset) for offset in range(days)
+                 if (base_date + timedelta(days=offset)).weekday() < 5]
+        n_days = len(dates)
+        n_syms = len(self.symbols)
+
+        # Draw every random input as a (days, symbols) matrix up front, then
+        # recover the per-day price recursion with one cumulative product:
+        # close[t] = close[t-1] * (1 + return[t]) * close_factor[t]
+        base_prices = self.rng.uniform(50, 500, size=n_syms)
+        returns = self.rng.normal(0.0005, 0.02, size=(n_days, n_syms))
+        high_factor = 1 + np.abs(self.rng.normal(0, 0.01, size=(n_days, n_syms)))
+        low_factor = 1 - np.abs(self.rng.normal(0, 0.01, size=(n_days, n_syms)))
+        # close = uniform(low, high), expressed as a factor on the open
+        close_factor = low_factor + self.rng.random((n_days, n_syms)) * (high_factor - low_factor)
+        # Daily volumes stay below 2**31 and dollar prices only need 6-7
+        # significant digits, so int32/float32 halve every downstream byte
+        volume = self.rng.uniform(1_000_000, 100_000_000, size=(n_days, n_syms)).astype(np.int32)
+
+        # low_factor <= close_factor <= high_factor guarantees
+        # low <= {open, close} <= high without any per-row clamping
+        close = base_prices[None, :] * np.cumprod((1 + returns) * close_factor, axis=0)
+        open_price = close / close_factor
+        high = open_price * high_factor
+        low = open_price * low_factor
+
+        return _to_arrow_backed(pd.DataFrame({
+            "date": np.repeat(dates, n_syms),
+            "symbol": np.tile(self.symbols, n_days),
+            "open": np.round(open_price.ravel(), 2).astype(np.float32),
+            "high": np.round(high.ravel(), 2).astype(np.float32),
+            "low": np.round(low.ravel(), 2).astype(np.float32),
+            "close": np.round(close.ravel(), 2).astype(np.float32),
+            "volume": volume.ravel(),
+            "adjusted_close": np.round(close.ravel() * 0.99, 2).astype(np.float32),  # Simplified adjustment
+        }))
+    
+    def generate_market_trades(self, stock_prices_df: pd.DataFrame, trades_per_day: int = 500) -> pd.DataFrame:
+        """Generate individual trade transactions."""
+        n_days = len(stock_prices_df)
+        n_trades = n_days * trades_per_day
+
+        # One batched draw per field instead of scalar np.random calls per
+        # trade. Each price row is repeated trades_per_day times.
+        dates = np.repeat(stock_prices_df["date"].to_numpy(), trades_per_day)
+        symbols = np.repeat(stock_prices_df["symbol"].to_numpy(), trades_per_day)
+        lows = np.repeat(stock_prices_df["low"].to_numpy(), trades_per_day)
+        highs = np.repeat(stock_prices_df["high"].to_numpy(), trades_per_day)
+
+        # Random trade time during market hours (9:30 AM - 4:00 PM ET):
+        # one draw of second-of-day offsets instead of separate
+        # hour/minute/second arrays
+        offsets = self.rng.integers(9 * 3600, 16 * 3600, size=n_trades)
+        timestamps = pd.to_datetime(dates) + pd.to_timedelta(offsets, unit="s")
+
+        # Trade price within day range
+        prices = np.round(lows + self.rng.random(n_trades) * (highs - lows), 2)
+        quantities = self.rng.lognormal(10, 1.5, size=n_trades).astype(np.int64)  # Lognormal for realistic volume
+        sides = self.rng.choice(["BUY", "SELL"], size=n_trades)
+        exchanges = self.rng.choice(self.exchanges, size=n_trades)
+
+        trade_ids = np.char.add("TRADE_",
+                                np.char.zfill(np.arange(1, n_trades + 1).astype(str), 10))
+
+        return _to_arrow_backed(pd.DataFrame({
+            "trade_id": trade_ids,
+            "timestamp": timestamps,
+            "date": dates,
+            "symbol": symbols,
+            "price": prices,
+            "quantity": quantities,
+            "side": sides,
+            "trade_value": np.round(prices * quantities, 2),
+            "exchange": exchanges,
+        }))
+    
+    def generate_market_metrics(self, stock_prices_df: pd.DataFrame, trades_df: pd.DataFrame) -> pd.DataFrame:
+        """Generate aggregated market metrics and technical indicators."""
+        records = []
+        
+        # Group by date and symbol
+        for (date, symbol), group in stock_prices_df.groupby(["date", "symbol"]):
+            row = group.iloc[0]
+            
+            # Filter trades for this date and symbol
+            trades = trades_df[(trades_df["date"] == date) & (trades_df["symbol"] == symbol)]
+            
+            if len(trades) == 0:
+                continue
+            
+            # Calculate metrics
+            avg_price = (row["open"] + row["close"] + row["high"] + row["low"]) / 4
+            price_range = row["high"] - row["low"]
+            volatility = self.rng.uniform(0.01, 0.05)  # Simplified
+            
+            buy_volume = trades[trades["side"] == "BUY"]["quantity"].sum()
+            sell_volume = trades[trades["side"] == "SELL"]["quantity"].sum()
+            total_volume = buy_volume + sell_volume
+            
+            buy_sell_ratio = buy_volume / sell_volume if sell_volume > 0 else 0
+            price_change_pct = ((row["close"] - row["open"]) / row["open"] * 100) if row["open"] > 0 else 0
+            
+            records.append({
+                "date": date,
+                "symbol": symbol,
+                "avg_price": round(avg_price, 2),
+                "price_range": round(price_range, 2),
+                "volatility": round(volatility, 4),
+                "total_volume": total_volume,
+                "buy_volume": buy_volume,
+                "sell_volume": sell_volume,
+                "buy_sell_ratio": round(buy_sell_ratio, 2),
+                "price_change_pct": round(price_change_pct, 2),
+                "sma_20": None,  # Would be calculated with more historical data
+                "sma_50": None,
+                "rsi_14": round(self.rng.uniform(30, 70), 2),  # Simplified
+                "market_cap_change": round(self.rng.uniform(-10, 10), 2),
+            })
+        
+        df = pd.DataFrame(records)
+        if len(df):
+            # Same width discipline as the price generator
+            df = df.astype({"buy_volume": np.int32, "sell_volume": np.int32,
+                            "buy_sell_ratio": np.float32})
+        return df
+    
+    def generate_portfolio_transactions(self, num_transactions: int = 1000) -> pd.DataFrame:
+        """Generate user portfolio transaction history."""
+        n = num_transactions
+        base_date = datetime.now().date() - timedelta(days=180)
+        portfolio_ids = np.array([f"PORT_{i:06d}" for i in range(1, 51)])  # 50 portfolios
+
+        # One batched draw per field; the frame is then built once from a
+        # dict of full-length arrays, so the block manager never reallocates
+        txn_ids = np.char.add("TXN_", np.char.zfill(np.arange(n).astype(str), 10))
+        timestamps = pd.to_datetime(base_date) + pd.to_timedelta(self.rng.integers(0, 180, size=n), unit="D")
+        symbols = self.rng.choice(self.symbols, size=n)
+        transaction_types = self.rng.choice(["BUY", "SELL", "DIVIDEND"], size=n, p=[0.5, 0.4, 0.1])
+        is_dividend = transaction_types == "DIVIDEND"
+
+        quantities = np.where(is_dividend, 0, self.rng.lognormal(5, 1.2, size=n).astype(np.int64))
+        prices = self.rng.uniform(50, 500, size=n)
+        total_amounts = np.where(is_dividend,
+                                 self.rng.uniform(100, 5000, size=n),
+                                 quantities * prices)
+
+        df = pd.DataFrame({
+            "transaction_id": txn_ids,
+            "portfolio_id": self.rng.choice(portfolio_ids, size=n),
+            "date": timestamps.date,
+            "timestamp": timestamps,
+            "symbol": symbols,
+            "transaction_type": transaction_types,
+            "quantity": quantities,
+            "price": np.round(prices, 2),
+            "total_amount": np.round(total_amounts, 2),
+            "fees": np.round(self.rng.uniform(0, 50, size=n), 2),
+            "sector": pd.Series(symbols).map(self.sectors).fillna("Other").to_numpy(),
+        })
+        # Low-cardinality string columns as Categorical: one uint8 code per
+        # row instead of a ~50-byte object cell, and isin/groupby compare
+        # codes rather than strings
+        df["symbol"] = pd.Categorical(df["symbol"], categories=self.symbols)
+        df["transaction_type"] = pd.Categorical(
+            df["transaction_type"], categories=["BUY", "SELL", "DIVIDEND"])
+        return _to_arrow_backed(df)
+
+
+class BigQueryDataLoader:
+    """Handles loading data into BigQuery tables."""
+    
+    def __init__(self, client):
+        """
+        Initialize with BigQuery client.
+        
+        Args:
+            client: google.cloud.bigquery.Client instance
+        """
+        self.client = client
+        logger.info("BigQueryDataLoader initialized")
+    
+    def load_dataframe_to_bq(
+        self,
+        dataframe: pd.DataFrame,
+        table_id: str,
+        write_disposition: str = "WRITE_APPEND",
+        job_config_kwargs: Dict[str, Any] = None,
+        chunk_size_rows: int = 5_000_000
+    ) -> None:
+        """
+        Load pandas DataFrame to BigQuery table.
+
+        Args:
+            dataframe: Pandas DataFrame to load
+            table_id: Fully qualified table ID (project.dataset.table)
+            write_disposition: WRITE_TRUNCATE or WRITE_APPEND
+            job_config_kwargs: Additional job configuration options
+            chunk_size_rows: Frames larger than this are split, loaded to
+                temp tables in parallel, and merged atomically
+
+        Note:
+            Batch load jobs count against the 1,500-loads-per-table daily
+            quota, so callers should batch frames rather than loading one
+            per partition.
+        """
+        # The same disposition/kwargs combinations recur across a pipeline
+        # run, so the config comes from a memoized factory; the copy keeps
+        # any per-job mutation out of the shared cached instance
+        try:
+            kwargs_frozen = tuple(sorted((job_config_kwargs or {}).items()))
+            job_config = copy.copy(_make_job_config(write_disposition, kwargs_frozen))
+        except TypeError:
+            # Unhashable kwargs values (lists, schema objects): build fresh
+            from google.cloud.bigquery import LoadJobConfig, SourceFormat
+            job_config = LoadJobConfig(
+                write_disposition=write_disposition,
+                source_format=SourceFormat.PARQUET,
+            )
+            for key, value in (job_config_kwargs or {}).items():
+                setattr(job_config, key, value)
+
+        # Oversized frames hit per-request payload/timeout limits and risk
+        # partial writes; split, load in parallel, and merge atomically
+        if len(dataframe) > chunk_size_rows:
+            self._load_chunked(dataframe, table_id, job_config, write_disposition, chunk_size_rows)
+            return
+
+        # Frames that fit one load job but are heavy in memory get spilled
+        # to disk, so the Parquet buffer is not held alongside the frame
+        if dataframe.memory_usage(deep=True).sum() > self._SPILL_BYTES:
+            try:
+                self._load_via_parquet_file(dataframe, table_id, job_config)
+                return
+            except ImportError:
+                pass  # pyarrow missing; fall through to the in-memory path
+
+        try:
+            job = self.client.load_table_from_dataframe(
+                dataframe,
+                table_id,
+                job_config=job_config,
+                parquet_compression="SNAPPY",
+            )
+            job.result()  # Wait for job to complete
+            logger.info(f"Loaded {len(dataframe)} rows to {table_id}")
+        except Exception as e:
+            logger.error(f"Failed to load data to {table_id}: {str(e)}")
+            raise
+
+    # In-memory frames above this spill to a temp Parquet file before upload
+    _SPILL_BYTES = 500 * 1024 * 1024
+
+    def _load_via_parquet_file(self, dataframe: pd.DataFrame, table_id: str, job_config) -> None:
+        """Upload one frame from a temp snappy Parquet file on disk.
+
+        load_table_from_dataframe materializes the whole Parquet buffer in
+        memory next to the frame; spilling to disk keeps peak RSS near the
+        frame itself and streams the upload from the file handle.
+        """
+        import os
+        import tempfile
+
+        fd, tmp_path = tempfile.mkstemp(suffix=".parquet")
+        os.close(fd)
+        try:
+            dataframe.to_parquet(tmp_path, engine="pyarrow", compression="snappy")
+            with open(tmp_path, "rb") as f:
+                job = self.client.load_table_from_file(f, table_id, job_config=job_config)
+            job.result()
+            logger.info(f"Loaded {len(dataframe)} rows to {table_id} via spilled Parquet")
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _load_chunked(
+        self,
+        dataframe: pd.DataFrame,
+        table_id: str,
+        job_config,
+        write_disposition: str,
+        chunk_size_rows: int
+    ) -> None:
+        """Load an oversized frame through parallel temp tables plus one merge.
+
+        Each chunk goes to a uniquely named temp table on a thread pool; the
+        destination is then written by a single atomic statement, so readers
+        never observe a partially loaded frame.
+        """
+        import uuid
+        from concurrent.futures import ThreadPoolExecutor
+
+        n_chunks = -(-len(dataframe) // chunk_size_rows)
+        chunks = np.array_split(dataframe, n_chunks)
+        suffix = uuid.uuid4().hex[:8]
+        tmp_ids = [f"{table_id}_tmp_{suffix}_{i}" for i in range(n_chunks)]
+
+        def _load(chunk, tmp_id):
+            job = self.client.load_table_from_dataframe(
+                chunk, tmp_id, job_config=job_config, parquet_compression="SNAPPY"
+            )
+            job.result()
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(_load, chunks, tmp_ids))
+
+            union = " UNION ALL ".join(f"SELECT * FROM `{tmp}`" for tmp in tmp_ids)
+            if write_disposition == "WRITE_TRUNCATE":
+                merge_sql = f"CREATE OR REPLACE TABLE `{table_id}` AS {union}"
+            else:
+                merge_sql = f"INSERT INTO `{table_id}` {union}"
+            self.client.query(merge_sql).result()
+            logger.info(f"Loaded {len(dataframe)} rows to {table_id} in {n_chunks} chunks")
+        finally:
+            for tmp in tmp_ids:
+                try:
+                    self.client.delete_table(tmp, not_found_ok=True)
+                except Exception:
+                    pass
+    
+    def _get_table_cached(self, table_id: str):
+        """Fetch table metadata, serving repeats from a 5-minute TTL cache."""
+        now = time.monotonic()
+        with _TABLE_CACHE_LOCK:
+            hit = _TABLE_CACHE.get(table_id)
+            if hit is not None and now - hit[0] < _TABLE_CACHE_TTL:
+                return hit[1]
+        table = self.client.get_table(table_id)
+        with _TABLE_CACHE_LOCK:
+            _TABLE_CACHE[table_id] = (now, table)
+        return table
+
+    def _ensure_one_table(self, dataset_id: str, schema_def: Dict[str, Any]) -> None:
+        """Create a single table from its schema definition if missing."""
+        from google.cloud.bigquery import Schema, SchemaField, Table, TimePartitioning
+
+        table_id = f"{self.client.project}.{dataset_id}.{schema_def['table_name']}"
+
+        # Check if table exists
+        try:
+            self._get_table_cached(table_id)
+            logger.info(f"Table {table_id} already exists")
+            return
+        except Exception:
+            pass  # Table doesn't exist, will create it
+
+        # Build schema
+        schema_fields = [
+            SchemaField(field["name"], field["type"], mode=field.get("mode", "NULLABLE"))
+            for field in schema_def["schema"]
+        ]
+
+        # Create table
+        table = Table(table_id, schema=Schema(schema_fields))
+
+        # Add partitioning
+        if "partitioning" in schema_def:
+            partitioning_def = schema_def["partitioning"]
+            table.time_partitioning = TimePartitioning(
+                type_=partitioning_def["type"],
+                field=partitioning_def["field"],
+                expiration_ms=partitioning_def.get("expiration_ms")
+            )
+
+        # Add clustering
+        if "clustering" in schema_def:
+            clustering_def = schema_def["clustering"]
+            table.clustering_fields = clustering_def["fields"]
+
+        # Create the table
+        table = self.client.create_table(table)
+        # Make the fresh table immediately visible to cached lookups
+        with _TABLE_CACHE_LOCK:
+            _TABLE_CACHE[table_id] = (time.monotonic(), table)
+        logger.info(f"Created table {table_id}")
+
+    def create_tables_if_not_exist(self, dataset_id: str, schemas: Dict[str, Any]) -> None:
+        """
+        Create BigQuery tables if they don't exist.
+
+        Each check/create is a metadata round-trip, so three or more tables
+        are handled on a thread pool; one or two just run inline.
+
+        Args:
+            dataset_id: Dataset ID
+            schemas: Dictionary of schema definitions
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if len(schemas) < 3:
+            for schema_def in schemas.values():
+                self._ensure_one_table(dataset_id, schema_def)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(schemas))) as pool:
+            # list() re-raises the first worker exception, matching the
+            # sequential error behavior
+            list(pool.map(lambda schema_def: self._ensure_one_table(dataset_id, schema_def),
+                          schemas.values()))
@@ -2,6 +2,7 @@
 BigQuery table schemas for financial data analytics.
 Optimized for analytical queries with appropriate partitioning and clustering.
 """
+import functools
 from typing import List, Dict, Any
 from enum import Enum
 
@@ -107,29 +108,49 @@ class TableSchema:
     
     @classmethod
     def get_create_table_ddl(cls, schema_dict: Dict[str, Any], dataset_id: str) -> str:
-        """Generates BigQuery CREATE TABLE DDL statement."""
-        table_name = schema_dict["table_name"]
-        description = schema_dict["description"]
-        fields = schema_dict["schema"]
-        clustering = schema_dict.get("clustering", {})
-        
-        # Build column definitions
-        columns = []
-        for field in fields:
-            nullable = "NULLABLE" if field["mode"] == "NULLABLE" else "NOT NULL"
-            columns.append(f"  {field['name']} {field['type']} {nullable}")
-        
-        columns_def = ",\n".join(columns)
-        
-        # Build DDL
-        ddl = f"""CREATE TABLE IF NOT EXISTS `{dataset_id}.{table_name}` (
+        """Generates BigQuery CREATE TABLE DDL statement.
+
+        The DDL is memoized on the frozen contents of the schema dict, so
+        idempotent reruns over the registry schemas skip the string
+        building while ad-hoc or modified dicts still produce their own
+        DDL.
+        """
+        fields_frozen = tuple(
+            (field["name"], field["type"], field["mode"])
+            for field in schema_dict["schema"]
+        )
+        clustering_fields = tuple(schema_dict.get("clustering", {})["fields"])
+        return cls._build_ddl_cached(
+            schema_dict["table_name"],
+            schema_dict["description"],
+            fields_frozen,
+            clustering_fields,
+            dataset_id,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_ddl_cached(
+        table_name: str,
+        description: str,
+        fields_frozen: tuple,
+        clustering_fields: tuple,
+        dataset_id: str,
+    ) -> str:
+        # One generator pass into join: no intermediate list or repeated
+        # concatenation
+        columns_def = ",\n".join(
+            f"  {name} {field_type} "
+            f"{'NULLABLE' if mode == 'NULLABLE' else 'NOT NULL'}"
+            for name, field_type, mode in fields_frozen
+        )
+
+        return f"""CREATE TABLE IF NOT EXISTS `{dataset_id}.{table_name}` (
 {columns_def}
 )
 PARTITION BY DATE(date)
-CLUSTER BY {', '.join(clustering['fields'])}
+CLUSTER BY {', '.join(clustering_fields)}
 OPTIONS(
   description="{description}",
   require_partition_filter=TRUE
 );"""
-        
-        return ddl
@@ -0,0 +1,15 @@
+"""
+Shared fixtures for the test suites.
+"""
+import pytest
+from src.data_loader import DataGenerator
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """One DataGenerator per test session (per xdist worker).
+
+    Construction cost is paid once; tests that need a pristine random
+    stream (e.g. reproducibility) build their own seeded instances.
+    """
+    return DataGenerator(seed=42)
@@ -1,84 +1,87 @@
-"""
-Test module for data generation and loading.
-"""
-import pytest
-import pandas as pd
-from datetime import datetime, timedelta
-from src.data_loader import DataGenerator
-
-
-class TestDataGenerator:
-    """Test suite for financial data generation."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.generator = DataGenerator(seed=42)
-    
-    def test_stock_prices_generation(self):
-        """Test stock price data generation."""
-        df = self.generator.generate_stock_prices(days=30)
-        
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) > 0
-        assert "date" in df.columns
-        assert "symbol" in df.columns
-        assert "open" in df.columns
-        assert "close" in df.columns
-        assert "volume" in df.columns
-    
-    def test_market_trades_generation(self):
-        """Test market trade data generation."""
-        stock_prices = self.generator.generate_stock_prices(days=10)
-        trades = self.generator.generate_market_trades(stock_prices, trades_per_day=50)
-        
-        assert len(trades) > 0
-        assert "trade_id" in trades.columns
-        assert "timestamp" in trades.columns
-        assert "symbol" in trades.columns
-        assert "side" in trades.columns
-        assert trades["side"].isin(["BUY", "SELL"]).all()
-    
-    def test_market_metrics_generation(self):
-        """Test market metrics aggregation."""
-        stock_prices = self.generator.generate_stock_prices(days=10)
-        trades = self.generator.generate_market_trades(stock_prices, trades_per_day=50)
-        metrics = self.generator.generate_market_metrics(stock_prices, trades)
-        
-        assert len(metrics) > 0
-        assert "volatility" in metrics.columns
-        assert "buy_volume" in metrics.columns
-        assert "sell_volume" in metrics.columns
-        assert "buy_sell_ratio" in metrics.columns
-    
-    def test_portfolio_transactions_generation(self):
-        """Test portfolio transaction generation."""
-        txns = self.generator.generate_portfolio_transactions(num_transactions=100)
-        
-        assert len(txns) == 100
-        assert "portfolio_id" in txns.columns
-        assert "symbol" in txns.columns
-        assert "transaction_type" in txns.columns
-        assert txns["transaction_type"].isin(["BUY", "SELL", "DIVIDEND"]).all()
-    
-    def test_data_consistency(self):
-        """Test data consistency across generated datasets."""
-        stock_prices = self.generator.generate_stock_prices(days=10)
-        
-        # Verify OHLC relationships
-        assert (stock_prices["high"] >= stock_prices["low"]).all()
-        assert (stock_prices["high"] >= stock_prices["open"]).all()
-        assert (stock_prices["high"] >= stock_prices["close"]).all()
-    
-    def test_reproducibility(self):
-        """Test that seed produces reproducible results."""
-        gen1 = DataGenerator(seed=42)
-        gen2 = DataGenerator(seed=42)
-        
-        df1 = gen1.generate_stock_prices(days=5)
-        df2 = gen2.generate_stock_prices(days=5)
-        
-        assert df1.equals(df2)
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+"""
+Test module for data generation and loading.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from src.data_loader import DataGenerator
+
+# Expected column sets, checked with one hash-based subset comparison per
+# frame instead of a linear Index scan per column
+_STOCK_PRICE_COLS = frozenset({"date", "symbol", "open", "high", "low", "close", "volume"})
+_TRADE_COLS = frozenset({"trade_id", "timestamp", "symbol", "side"})
+_METRIC_COLS = frozenset({"volatility", "buy_volume", "sell_volume", "buy_sell_ratio"})
+_TXN_COLS = frozenset({"portfolio_id", "symbol", "transaction_type"})
+
+
+class TestDataGenerator:
+    """Test suite for financial data generation."""
+
+    def test_stock_prices_generation(self, generator):
+        """Test stock price data generation."""
+        df = generator.generate_stock_prices(days=30)
+        
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) > 0
+        assert _STOCK_PRICE_COLS <= set(df.columns)
+        # Prices are quantized to float32 ($ values need 6-7 significant
+        # digits); accept the pyarrow-backed spelling when it is installed
+        assert str(df["open"].dtype) in ("float32", "float[pyarrow]")
+    
+    def test_market_trades_generation(self, generator):
+        """Test market trade data generation."""
+        stock_prices = generator.generate_stock_prices(days=10)
+        trades = generator.generate_market_trades(stock_prices, trades_per_day=50)
+        
+        assert len(trades) > 0
+        assert _TRADE_COLS <= set(trades.columns)
+        assert trades["side"].isin(["BUY", "SELL"]).all()
+    
+    def test_market_metrics_generation(self, generator):
+        """Test market metrics aggregation."""
+        stock_prices = generator.generate_stock_prices(days=10)
+        trades = generator.generate_market_trades(stock_prices, trades_per_day=50)
+        metrics = generator.generate_market_metrics(stock_prices, trades)
+        
+        assert len(metrics) > 0
+        assert _METRIC_COLS <= set(metrics.columns)
+    
+    def test_portfolio_transactions_generation(self, generator):
+        """Test portfolio transaction generation."""
+        txns = generator.generate_portfolio_transactions(num_transactions=100)
+        
+        assert len(txns) == 100
+        assert _TXN_COLS <= set(txns.columns)
+        # transaction_type is Categorical over BUY/SELL/DIVIDEND, so a
+        # bound check on the integer codes replaces per-row string hashing
+        # (-1 would mean a value outside the declared categories)
+        codes = txns["transaction_type"].cat.codes.to_numpy()
+        assert ((codes >= 0) & (codes < 3)).all()
+    
+    def test_data_consistency(self, generator):
+        """Test data consistency across generated datasets."""
+        stock_prices = generator.generate_stock_prices(days=10)
+
+        # Verify OHLC relationships in one vectorized pass instead of a
+        # boolean Series per comparison
+        arr = stock_prices[["high", "low", "open", "close"]].to_numpy(copy=False)
+        high = arr[:, 0]
+        assert np.all((high >= arr[:, 1]) & (high >= arr[:, 2]) & (high >= arr[:, 3]))
+    
+    def test_reproducibility(self):
+        """Test that seed produces reproducible results."""
+        gen1 = DataGenerator(seed=42)
+        gen2 = DataGenerator(seed=42)
+        
+        df1 = gen1.generate_stock_prices(days=5)
+        df2 = gen2.generate_stock_prices(days=5)
+
+        # Block-wise vectorized comparison with a diagnostic diff on
+        # failure; exact equality holds because the RNG and the rounding
+        # are both deterministic
+        pd.testing.assert_frame_equal(df1, df2, check_exact=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,7 +2,20 @@
 Test module for query optimization and analytics engine.
 """
 import pytest
-from src.analytics_engine import QueryOptimizer
+from src.analytics_engine import CostBudgetExceeded, QueryOptimizer
+
+
+class _FakeDryRunJob:
+    def __init__(self, total_bytes_processed):
+        self.total_bytes_processed = total_bytes_processed
+
+
+class _FakeClient:
+    def __init__(self, total_bytes_processed):
+        self._bytes = total_bytes_processed
+
+    def query(self, query, job_config=None):
+        return _FakeDryRunJob(self._bytes)
 
 
 class TestQueryOptimizer:
@@ -10,14 +23,28 @@ class TestQueryOptimizer:
     
     def test_cost_estimation(self):
         """Test BigQuery cost estimation."""
-        # 1 TB of data
+        # 1 TiB of data
         cost = QueryOptimizer.estimate_query_cost(1024 ** 4)
-        assert cost == 7.0  # $7 per TB
-        
-        # 0.1 TB of data
+        assert cost == 7.0  # $7 per TiB
+
+        # 100 GiB of data: 100/1024 TiB * $7, exact in binary floating point
         cost = QueryOptimizer.estimate_query_cost(100 * 1024 ** 3)
-        assert cost == 0.7
+        assert cost == 0.68359375
     
+    def test_dry_run_cost_within_budget(self):
+        """Test dry-run gate returns the estimate for affordable queries."""
+        client = _FakeClient(total_bytes_processed=100 * 1024 ** 3)
+        cost = QueryOptimizer.dry_run_cost("SELECT col FROM t", client)
+
+        assert cost == 0.68359375
+
+    def test_dry_run_cost_over_budget(self):
+        """Test dry-run gate refuses queries scanning above the budget."""
+        client = _FakeClient(total_bytes_processed=2 * 1024 ** 4)
+
+        with pytest.raises(CostBudgetExceeded):
+            QueryOptimizer.dry_run_cost("SELECT * FROM huge", client)
+
     def test_optimization_tips_select_star(self):
         """Test detection of SELECT * pattern."""
         query = "SELECT * FROM my_table"